@@ -6,8 +6,11 @@ calculating metrics like file size, resolution, PSNR, and generating reports.
 """
 
 import os
+import sys
 import json
 import csv
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from PIL import Image
 import numpy as np
@@ -15,6 +18,19 @@ from skimage.metrics import peak_signal_noise_ratio, structural_similarity
 import pandas as pd
 
 
+# Columns written by the CSV report, in output order
+CSV_COLUMNS = ['filename', 'size_a', 'size_b', 'size_diff', 'size_ratio',
+               'resolution_a', 'resolution_b', 'resolution_match',
+               'mode_a', 'mode_b', 'mode_match', 'psnr', 'ssim',
+               'frames_a', 'frames_b', 'framerate_a', 'framerate_b']
+
+# File extensions treated as images when scanning directories
+_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif'}
+
+# Units used by _format_size, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
 def compare_directories(dir_a, dir_b, output_format="table", output_file=None):
     """
     Compare identical filenames across two directories.
@@ -55,10 +71,12 @@ def compare_directories(dir_a, dir_b, output_format="table", output_file=None):
     # Compare common files
     comparison_results = []
     
-    for filename in sorted(common_files):
-        print(f"Comparing {filename}...")
-        result = _compare_images(files_a[filename], files_b[filename], filename)
-        comparison_results.append(result)
+    # One decode pool for the whole run, shared by every image pair
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for filename in sorted(common_files):
+            print(f"Comparing {filename}...")
+            result = _compare_images(files_a[filename], files_b[filename], filename, executor)
+            comparison_results.append(result)
     
     # Generate report
     report_data = {
@@ -85,20 +103,33 @@ def compare_directories(dir_a, dir_b, output_format="table", output_file=None):
 
 def _get_image_files(directory):
     """Get all image files in a directory."""
-    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif'}
     files = {}
     
-    for file_path in directory.rglob('*'):
-        if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-            # Use relative path from directory as key
-            rel_path = file_path.relative_to(directory)
-            files[str(rel_path)] = file_path
+    # Walk with os.scandir so file/dir checks come from the directory entries;
+    # like rglob, symlinked directories are not descended into
+    pending = [(directory, '')]
+    while pending:
+        current, prefix = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                # Use relative path from directory as key
+                rel_path = os.path.join(prefix, entry.name) if prefix else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, rel_path))
+                elif (os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS and
+                      entry.is_file()):
+                    files[rel_path] = Path(entry.path)
     
     return files
 
 
-def _compare_images(image_a_path, image_b_path, filename):
-    """Compare two images and return metrics."""
+def _compare_images(image_a_path, image_b_path, filename, executor=None):
+    """Compare two images and return metrics, decoding on executor when given."""
     result = {
         'filename': filename,
         'file_a': str(image_a_path),
@@ -121,8 +152,24 @@ def _compare_images(image_a_path, image_b_path, filename):
             # Handle GIF comparison
             result.update(_compare_gif_animations(image_a_path, image_b_path))
         else:
-            # Handle static image comparison
-            with Image.open(image_a_path) as img_a, Image.open(image_b_path) as img_b:
+            # Handle static image comparison; decode both files concurrently on
+            # the shared pool (libjpeg/libpng release the GIL while decoding)
+            paths = (image_a_path, image_b_path)
+            images = []
+            try:
+                if executor is None:
+                    for path in paths:
+                        images.append(_decode_image(path))
+                else:
+                    futures = [executor.submit(_decode_image, path) for path in paths]
+                    wait(futures)
+                    # Keep whichever image decoded so it is closed below,
+                    # then re-raise the first decode error
+                    images = [future.result() for future in futures if future.exception() is None]
+                    for future in futures:
+                        future.result()
+                img_a, img_b = images
+                
                 # Get resolutions
                 result['resolution_a'] = f"{img_a.width}x{img_a.height}"
                 result['resolution_b'] = f"{img_b.width}x{img_b.height}"
@@ -147,6 +194,9 @@ def _compare_images(image_a_path, image_b_path, filename):
                     result['psnr'] = None
                     result['ssim'] = None
                     result['metrics_error'] = "Resolution mismatch"
+            finally:
+                for img in images:
+                    img.close()
                     
     except Exception as e:
         result['error'] = str(e)
@@ -154,6 +204,13 @@ def _compare_images(image_a_path, image_b_path, filename):
     return result
 
 
+def _decode_image(image_path):
+    """Open and fully decode an image so it stays usable after the file is closed."""
+    with Image.open(image_path) as img:
+        img.load()
+        return img
+
+
 def _calculate_image_metrics(img_a, img_b):
     """Calculate PSNR and SSIM between two images."""
     # Convert to same mode if needed
@@ -169,9 +226,9 @@ def _calculate_image_metrics(img_a, img_b):
             img_a = img_a.convert('RGB')
             img_b = img_b.convert('RGB')
     
-    # Convert to numpy arrays
-    arr_a = np.array(img_a)
-    arr_b = np.array(img_b)
+    # Convert to numpy arrays (read-only views are enough for the metrics)
+    arr_a = np.asarray(img_a)
+    arr_b = np.asarray(img_b)
     
     # Ensure same shape
     if arr_a.shape != arr_b.shape:
@@ -431,30 +488,37 @@ def _output_csv(comparison_results, output_file=None):
         print("No comparison data to output")
         return
     
-    # Create DataFrame
-    df = pd.DataFrame(comparison_results)
-    
-    # Select relevant columns
-    columns = ['filename', 'size_a', 'size_b', 'size_diff', 'size_ratio', 
-               'resolution_a', 'resolution_b', 'resolution_match',
-               'mode_a', 'mode_b', 'mode_match', 'psnr', 'ssim',
-               'frames_a', 'frames_b', 'framerate_a', 'framerate_b']
-    
-    # Filter columns that exist
-    available_columns = [col for col in columns if col in df.columns]
-    df_output = df[available_columns]
+    # Filter columns that exist in at least one result
+    available_columns = [col for col in CSV_COLUMNS
+                         if any(col in comp for comp in comparison_results)]
     
     # Output to console (first 10 rows)
     print("CSV Preview (first 10 rows):")
-    print(df_output.head(10).to_string(index=False))
+    print(_format_table(list(itertools.islice(comparison_results, 10)), available_columns))
     
     if output_file:
-        df_output.to_csv(output_file, index=False)
+        # Stream rows straight to disk
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=available_columns, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(comparison_results)
         print(f"\nFull CSV report saved to: {output_file}")
     else:
         # If no output file specified, print full CSV
         print("\nFull CSV data:")
-        print(df_output.to_csv(index=False))
+        writer = csv.DictWriter(sys.stdout, fieldnames=available_columns, extrasaction='ignore',
+                                lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(comparison_results)
+
+
+def _format_table(rows, columns):
+    """Format rows as a right-aligned text table, with NaN for missing values."""
+    cells = [[str(row.get(col, 'NaN')) for col in columns] for row in rows]
+    widths = [max([len(col)] + [len(line[i]) for line in cells]) for i, col in enumerate(columns)]
+    lines = [columns] + cells
+    return '\n'.join(' '.join(cell.rjust(width) for cell, width in zip(line, widths))
+                     for line in lines)
 
 
 def _format_size(size_bytes):
@@ -462,13 +526,9 @@ def _format_size(size_bytes):
     if size_bytes == 0:
         return "0B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f}{size_names[i]}"
+    # Pick the unit from the integer bit length instead of repeated division
+    i = min(len(_SIZE_UNITS) - 1, max(0, int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (i * 10)):.1f}{_SIZE_UNITS[i]}"
 
 
 def analyze_image_quality(image_path):
@@ -501,21 +561,24 @@ def analyze_image_quality(image_path):
                 uncompressed_size = img.width * img.height * (analysis['bits_per_pixel'] / 8)
                 analysis['compression_ratio'] = uncompressed_size / analysis['file_size']
             
-            # Histogram analysis
+            # Histogram analysis (derived from PIL's per-band histogram,
+            # all bands pooled together)
             if img.mode in ('RGB', 'L'):
-                arr = np.array(img)
-                analysis['mean_intensity'] = np.mean(arr)
-                analysis['std_intensity'] = np.std(arr)
-                analysis['min_intensity'] = np.min(arr)
-                analysis['max_intensity'] = np.max(arr)
+                hist = np.asarray(img.histogram(), dtype=np.int64).reshape(-1, 256).sum(axis=0)
+                values = np.arange(256)
+                total = hist.sum()
+                mean = (hist * values).sum() / total
+                present = values[hist > 0]
+                analysis['mean_intensity'] = float(mean)
+                variance = (hist * (values - mean) ** 2).sum() / total
+                analysis['std_intensity'] = float(np.sqrt(variance))
+                analysis['min_intensity'] = int(present.min())
+                analysis['max_intensity'] = int(present.max())
             
-            # EXIF data if available
-            if hasattr(img, '_getexif') and img._getexif():
-                analysis['has_exif'] = True
-                analysis['exif_entries'] = len(img._getexif())
-            else:
-                analysis['has_exif'] = False
-                analysis['exif_entries'] = 0
+            # EXIF data if available (parse once, it can be large)
+            exif = img._getexif() if hasattr(img, '_getexif') else None
+            analysis['has_exif'] = bool(exif)
+            analysis['exif_entries'] = len(exif) if exif else 0
             
             return analysis
             
@@ -8,89 +8,99 @@ that meet all specifications for comprehensive format variation testing.
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from PIL import PngImagePlugin
-import noise
 import piexif
-import colorsys
+import functools
 import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def create_jpeg_test_image(width=640, height=480):
+def create_jpeg_test_image(width=640, height=480, seed=None):
     """
     Generate an ideal JPEG test image with diverse frequency components and color information.
     
     Args:
         width (int): Image width in pixels
         height (int): Image height in pixels
+        seed (int, optional): Seed for the random elements; None for fresh randomness
     
     Returns:
         PIL.Image: Generated RGB image suitable for JPEG testing
     """
+    rng = np.random.default_rng(seed)
+    
     # Initialize base image array
     img = np.zeros((height, width, 3), dtype=np.uint8)
     
     # 1. Sky gradient (low-frequency components)
-    for y in range(height//3):
-        gradient_pos = y / (height//3)
-        blue_val = int(255 * (1 - gradient_pos) * 0.8)
-        white_mix = int(255 * gradient_pos * 0.3)
-        img[y, :] = [blue_val + white_mix, blue_val + white_mix, 255]
+    sky_height = height // 3
+    gradient_pos = np.arange(sky_height) / sky_height
+    blue_val = (255 * (1 - gradient_pos) * 0.8).astype(np.uint8)
+    white_mix = (255 * gradient_pos * 0.3).astype(np.uint8)
+    sky = (blue_val + white_mix)[:, None]
+    img[:sky_height, :, 0] = sky
+    img[:sky_height, :, 1] = sky
+    img[:sky_height, :, 2] = 255
     
     # 2. Ground/grass area (high-frequency components)
-    for y in range(height//3, height):
-        for x in range(width):
-            grass_noise = noise.pnoise2(x/50, y/50, octaves=4)
-            green_base = 80 + int(grass_noise * 40)
-            img[y, x] = [
-                green_base//3,
-                green_base,
-                green_base//4
-            ]
+    noise_x = (np.arange(width) / 50)[None, :]
+    noise_y = (np.arange(height//3, height) / 50)[:, None]
+    grass_noise = perlin_noise2(noise_x, noise_y, octaves=4)
+    green_base = 80 + np.trunc(grass_noise * 40).astype(np.int32)
+    img[height//3:, :, 0] = green_base // 3
+    img[height//3:, :, 1] = green_base
+    img[height//3:, :, 2] = green_base // 4
     
     # 3. Flower scatter (colorful point elements)
-    flower_colors = [
+    flower_colors = np.array([
         [255, 100, 100],  # Red
         [255, 255, 100],  # Yellow
         [150, 100, 255],  # Purple
         [255, 150, 200]   # Pink
-    ]
+    ], dtype=np.uint8)
     
     # Scale flower count and size based on image area
     flower_count = max(200, (width * height) // 300)  # Density-based count
     flower_radius = max(1, min(width, height) // 160)  # Adaptive size
     
-    for _ in range(flower_count):
-        x = np.random.randint(0, width)
-        y = np.random.randint(height//2, height)
-        color = flower_colors[np.random.randint(0, len(flower_colors))]
-        
-        for dx in range(-flower_radius, flower_radius + 1):
-            for dy in range(-flower_radius, flower_radius + 1):
-                if (0 <= x+dx < width and 
-                    0 <= y+dy < height and 
-                    dx*dx + dy*dy <= flower_radius*flower_radius):
-                    img[y+dy, x+dx] = color
+    # Disk offsets shared by every flower
+    dy, dx = np.mgrid[-flower_radius:flower_radius + 1, -flower_radius:flower_radius + 1]
+    disk = dx*dx + dy*dy <= flower_radius*flower_radius
+    offset_y, offset_x = dy[disk], dx[disk]
     
-    # 4. Cloud layer (soft white regions)
-    cloud_layer = np.zeros((height, width))
+    flower_x = rng.integers(0, width, flower_count)
+    flower_y = rng.integers(height//2, height, flower_count)
+    flower_color = rng.integers(0, len(flower_colors), flower_count)
+    
+    # Stamp all flowers at once; later flowers overwrite earlier ones
+    stamp_x = flower_x[:, None] + offset_x[None, :]
+    stamp_y = flower_y[:, None] + offset_y[None, :]
+    inside = (stamp_x >= 0) & (stamp_x < width) & (stamp_y >= 0) & (stamp_y < height)
+    stamp_color = np.broadcast_to(flower_color[:, None], stamp_x.shape)
+    img[stamp_y[inside], stamp_x[inside]] = flower_colors[stamp_color[inside]]
     
+    # 4. Cloud layer (soft white regions)
     # Scale cloud parameters based on image size
     cloud_radius = max(50, min(width, height) // 8)  # Adaptive cloud size
     cloud_margin = cloud_radius
+    cloud_count = 5
     
-    for i in range(5):
-        cx = np.random.randint(cloud_margin, width - cloud_margin)
-        cy = np.random.randint(0, height//4)
-        
-        x_coords = np.arange(width)[None, :]
-        y_coords = np.arange(height)[:, None]
-        
-        cloud = np.exp(-((x_coords - cx)**2 + (y_coords - cy)**2) / (cloud_radius**2))
-        cloud_layer += cloud * 0.3
+    cx = rng.integers(cloud_margin, width - cloud_margin, cloud_count)
+    cy = rng.integers(0, height//4, cloud_count)
     
-    cloud_layer = np.clip(cloud_layer, 0, 1)
-    for c in range(3):
-        img[:, :, c] = np.clip(img[:, :, c] + cloud_layer * 100, 0, 255)
+    # Each Gaussian is separable, so sum the outer products of the per-axis
+    # factors in one matrix multiply instead of accumulating HxW layers
+    cloud_x = np.exp(-(np.arange(width)[None, :] - cx[:, None])**2 / (cloud_radius**2))
+    cloud_y = np.exp(-(np.arange(height)[None, :] - cy[:, None])**2 / (cloud_radius**2))
+    cloud_layer = np.clip((cloud_y.T @ cloud_x) * 0.3, 0, 1)
+    
+    # Add and clip in one int16 scratch buffer to avoid extra temporaries
+    cloud_add = (cloud_layer * 100).astype(np.int16)[:, :, None]
+    composite = img.astype(np.int16)
+    np.add(composite, cloud_add, out=composite)
+    np.clip(composite, 0, 255, out=composite)
+    img[:] = composite
     
     # 5. Human skin color elements
     person_x, person_y = width//4, height//2
@@ -100,39 +110,42 @@ def create_jpeg_test_image(width=640, height=480):
     person_width = max(15, width // 20)  # Adaptive width
     person_height = max(20, height // 12)  # Adaptive height
     
-    for dx in range(-person_width, person_width + 1):
-        for dy in range(-person_height, person_height + 1):
-            if (dx*dx)/(person_width*person_width) + (dy*dy)/(person_height*person_height) <= 1:
-                if (0 <= person_x+dx < width and 
-                    0 <= person_y+dy < height):
-                    img[person_y+dy, person_x+dx] = skin_color
+    dy, dx = np.ogrid[-person_height:person_height + 1, -person_width:person_width + 1]
+    ellipse = (dx*dx)/(person_width*person_width) + (dy*dy)/(person_height*person_height) <= 1
+    
+    # Clip the ellipse's bounding box to the image
+    y0, y1 = max(0, person_y - person_height), min(height, person_y + person_height + 1)
+    x0, x1 = max(0, person_x - person_width), min(width, person_x + person_width + 1)
+    ellipse = ellipse[y0 - (person_y - person_height):y1 - (person_y - person_height),
+                      x0 - (person_x - person_width):x1 - (person_x - person_width)]
+    img[y0:y1, x0:x1][ellipse] = skin_color
     
     return Image.fromarray(img)
 
 
-def create_png_test_image(width=480, height=480):
+def create_png_test_image(width=480, height=480, seed=None):
     """
     Generate an ideal PNG test image with transparency, sharp edges, and various elements.
     
     Args:
         width (int): Image width in pixels
         height (int): Image height in pixels
+        seed (int, optional): Seed for the random elements; None for fresh randomness
     
     Returns:
         PIL.Image: Generated RGBA image suitable for PNG testing
     """
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    rng = np.random.default_rng(seed)
     
     # 1. Background gradient with transparency
-    pixels = img.load()
-    for y in range(height):
-        alpha = int(128 * (1 - y / height))
-        
-        for x in range(width):
-            hue = (x / width) * 360
-            rgb = hsv_to_rgb(hue, 0.8, 0.9)
-            pixels[x, y] = (*rgb, alpha)
+    # Hue varies only with x and alpha only with y, so build one row of
+    # colors and one column of alphas and broadcast them into an RGBA buffer
+    background = np.empty((height, width, 4), dtype=np.uint8)
+    background[:, :, :3] = hsv_to_rgb_array(np.arange(width) / width * 360, 0.8, 0.9)[None, :, :]
+    background[:, :, 3] = (128 * (1 - np.arange(height) / height)).astype(np.uint8)[:, None]
+    
+    img = Image.fromarray(background)
+    draw = ImageDraw.Draw(img)
     
     # 2. Geometric shapes (opaque regions) - scaled to image size
     shape_size = min(width, height) // 4  # Adaptive shape size
@@ -166,27 +179,12 @@ def create_png_test_image(width=480, height=480):
                 fill=(100, 100, 255, 255),
                 outline=(50, 50, 150, 255))
     
-    # 3. Semi-transparent gradient effect - centered and scaled
-    center_x, center_y = width // 2, height // 2
-    max_radius = min(width, height) // 6  # Adaptive radius
-    radius_step = max(2, max_radius // 20)  # Adaptive step size
-    
-    for radius in range(max_radius, 0, -radius_step):
-        alpha = int(255 * (radius / max_radius) * 0.3)
-        draw.ellipse([center_x - radius, center_y - radius,
-                     center_x + radius, center_y + radius], 
-                    fill=(255, 255, 0, alpha))
-    
-    # 4. Text elements - scaled font and positioned
+    # 3. Text elements - scaled font and positioned
     font_large_size = max(12, min(width, height) // 12)  # Adaptive font size
     font_medium_size = max(8, font_large_size * 2 // 3)  # Proportional medium font
     
-    try:
-        font_large = ImageFont.truetype("arial.ttf", font_large_size)
-        font_medium = ImageFont.truetype("arial.ttf", font_medium_size)
-    except (OSError, IOError):
-        font_large = ImageFont.load_default()
-        font_medium = ImageFont.load_default()
+    font_large = _load_font("arial.ttf", font_large_size)
+    font_medium = _load_font("arial.ttf", font_medium_size)
     
     text = "Test テスト 测试"
     text_x, text_y = width // 20, height - height // 4  # Positioned relative to image size
@@ -198,44 +196,70 @@ def create_png_test_image(width=480, height=480):
     draw.text((text_x, text_y + font_large_size + 10), "PNG Alpha Test Image", 
              fill=(200, 200, 200, 200), font=font_medium)
     
+    # Steps 4-6 are plain array work, so switch to a NumPy buffer once for all
+    # of them. The text above lies below the radial gradient's reach, so
+    # drawing it first does not change the result.
+    arr = np.array(img)
+    
+    # 4. Semi-transparent gradient effect - centered and scaled
+    center_x, center_y = width // 2, height // 2
+    max_radius = min(width, height) // 6  # Adaptive radius
+    radius_step = max(2, max_radius // 20)  # Adaptive step size
+    
+    # Each pixel takes the color of the smallest ring that covers it, so
+    # rasterize all rings at once by looking up the squared distance in the
+    # ascending ring radii instead of drawing the disks largest-first
+    radii = np.arange(max_radius, 0, -radius_step)[::-1]
+    ring_alpha = (255 * (radii / max_radius) * 0.3).astype(np.uint8)
+    
+    x0, x1 = max(0, center_x - max_radius), min(width, center_x + max_radius + 1)
+    y0, y1 = max(0, center_y - max_radius), min(height, center_y + max_radius + 1)
+    yy, xx = np.ogrid[y0:y1, x0:x1]
+    dist2 = 4 * ((xx - center_x) ** 2 + (yy - center_y) ** 2)
+    ring = np.searchsorted((2 * radii + 1) ** 2, dist2)
+    inside = ring < radii.size
+    
+    overlay = arr[y0:y1, x0:x1]
+    overlay[inside, :3] = (255, 255, 0)
+    overlay[inside, 3] = ring_alpha[ring[inside]]
+    
     # 5. Complex transparency pattern - scaled checker size
     checker_size = max(10, min(width, height) // 12)  # Adaptive checker size
-    alpha_levels = [0, 128, 255]
-    
-    for x in range(0, width, checker_size):
-        for y in range(height//2, height, checker_size):
-            checker_x = x // checker_size
-            checker_y = y // checker_size
-            
-            alpha_index = (checker_x + checker_y) % 3
-            alpha = alpha_levels[alpha_index]
-            
-            red = min(255, (x * 255) // width)
-            green = min(255, (y * 255) // height)
-            blue = 128
-            
-            draw.rectangle([x, y, x + checker_size, y + checker_size], 
-                          fill=(red, green, blue, alpha))
+    alpha_levels = np.array([0, 128, 255], dtype=np.uint8)
+    checker_top = height // 2
+    
+    # Resolve colors per checker cell, then repeat each cell out to pixels
+    # and write the tiles straight into the lower half of the buffer
+    cell_x = np.arange(0, width, checker_size)
+    cell_y = np.arange(checker_top, height, checker_size)
+    cell_alpha = alpha_levels[(cell_x[None, :] // checker_size +
+                               cell_y[:, None] // checker_size) % 3]
+    
+    checker = arr[checker_top:]
+    checker[..., 0] = np.repeat(np.minimum(255, (cell_x * 255) // width),
+                                checker_size)[None, :width]
+    checker[..., 1] = np.repeat(np.minimum(255, (cell_y * 255) // height),
+                                checker_size)[:height - checker_top, None]
+    checker[..., 2] = 128
+    checker[..., 3] = np.repeat(np.repeat(cell_alpha, checker_size, axis=0),
+                                checker_size, axis=1)[:height - checker_top, :width]
     
     # 6. Fine detail noise pattern - scaled noise count
-    pixels = img.load()
     noise_count = max(1000, (width * height) // 25)  # Density-based noise count
     
-    for _ in range(noise_count):
-        x = np.random.randint(0, width)
-        y = np.random.randint(0, height)
-        
-        current_pixel = pixels[x, y]
-        
-        if current_pixel[3] > 0:
-            noise_val = np.random.randint(-20, 21)
-            r, g, b, a = current_pixel
-            pixels[x, y] = (
-                np.clip(r + noise_val, 0, 255),
-                np.clip(g + noise_val, 0, 255), 
-                np.clip(b + noise_val, 0, 255),
-                a
-            )
+    noise_x = rng.integers(0, width, noise_count)
+    noise_y = rng.integers(0, height, noise_count)
+    
+    # Only perturb pixels that are not fully transparent
+    visible = arr[noise_y, noise_x, 3] > 0
+    noise_x, noise_y = noise_x[visible], noise_y[visible]
+    noise_val = rng.integers(-20, 21, noise_x.size, dtype=np.int16)
+    
+    noisy = arr[noise_y, noise_x, :3].astype(np.int16) + noise_val[:, None]
+    arr[noise_y, noise_x, :3] = np.clip(noisy, 0, 255)
+    
+    img = Image.fromarray(arr)
+    draw = ImageDraw.Draw(img)
     
     # 7. Anti-aliased curved elements - scaled and positioned
     arc_size = min(width, height) // 4  # Adaptive arc size
@@ -246,77 +270,225 @@ def create_png_test_image(width=480, height=480):
             start=0, end=180, fill=(255, 0, 255, 200), width=arc_stroke)
     
     # Curved line - positioned and scaled
-    curve_points = []
     curve_length = min(width, height) // 3
     curve_amplitude = curve_length // 4
     curve_start_x = width // 4
     curve_start_y = height - height // 4
     
-    for i in range(50):  # Reduced points for smaller images
-        t = i / 49.0
-        x = int(curve_start_x + curve_length * t + curve_amplitude * np.sin(t * 6.28))
-        y = int(curve_start_y + curve_amplitude * np.sin(t * 3.14))
-        # Keep points within bounds
-        x = max(0, min(width - 1, x))
-        y = max(0, min(height - 1, y))
-        curve_points.append((x, y))
+    t = np.arange(50) / 49.0  # Reduced points for smaller images
+    curve_xs = (curve_start_x + curve_length * t + curve_amplitude * np.sin(t * 6.28)).astype(int)
+    curve_ys = (curve_start_y + curve_amplitude * np.sin(t * 3.14)).astype(int)
+    # Keep points within bounds
+    curve_points = list(zip(np.clip(curve_xs, 0, width - 1).tolist(),
+                            np.clip(curve_ys, 0, height - 1).tolist()))
     
     curve_stroke = max(1, min(width, height) // 120)  # Adaptive curve stroke
-    for i in range(len(curve_points) - 1):
-        draw.line([curve_points[i], curve_points[i + 1]], 
-                 fill=(0, 255, 255, 180), width=curve_stroke)
+    draw.line(curve_points, fill=(0, 255, 255, 180), width=curve_stroke)
     
     return img
 
 
+# Ken Perlin's reference permutation, doubled to avoid index wrapping
+_PERLIN_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+] * 2, dtype=np.intp)
+
+# Gradient x/y components indexed by the low 4 bits of a permutation hash
+_PERLIN_GRAD_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0],
+                          dtype=np.float32)
+_PERLIN_GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1],
+                          dtype=np.float32)
+
+
+def perlin_noise2(x, y, octaves=1, persistence=0.5, lacunarity=2.0, repeat=1024):
+    """
+    Vectorized 2D Perlin "improved" noise, matching noise.pnoise2.
+    
+    Uses float32 arithmetic like the C implementation, so results agree with
+    calling pnoise2 per coordinate. Lattice terms are computed on x and y
+    before broadcasting, so passing a row vector and a column vector evaluates
+    a whole grid cheaply.
+    
+    Args:
+        x (array-like): X coordinates
+        y (array-like): Y coordinates (broadcast against x)
+        octaves (int): Number of fBm passes
+        persistence (float): Amplitude multiplier per octave
+        lacunarity (float): Frequency multiplier per octave
+        repeat (int): Tiling period along both axes
+    
+    Returns:
+        numpy.ndarray: Noise values (float32), roughly in [-1, 1]
+    """
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    perm = _PERLIN_PERM
+    
+    def grad2(hash_value, gx, gy):
+        h = hash_value & 15
+        return gx * _PERLIN_GRAD_X[h] + gy * _PERLIN_GRAD_Y[h]
+    
+    def lerp(t, a, b):
+        return a + t * (b - a)
+    
+    def lattice(coord, period):
+        # Cell index, wrapped neighbour index, offset in cell, fade curve
+        cell = np.floor(np.fmod(coord, period)).astype(np.intp)
+        next_cell = np.fmod((cell + 1).astype(np.float32), period).astype(np.intp) & 255
+        offset = coord - np.floor(coord)
+        fade = offset * offset * offset * (offset * (offset * 6 - 15) + 10)
+        return cell & 255, next_cell, offset, fade
+    
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    amp_total = np.float32(0.0)
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.float32)
+    
+    for _ in range(octaves):
+        period = np.float32(repeat) * freq
+        i, ii, xf, fx = lattice(x * freq, period)
+        j, jj, yf, fy = lattice(y * freq, period)
+        
+        a = perm[i]
+        b = perm[ii]
+        aa, ab = perm[a + j], perm[a + jj]
+        ba, bb = perm[b + j], perm[b + jj]
+        
+        octave = lerp(fy,
+                      lerp(fx, grad2(perm[aa], xf, yf), grad2(perm[ba], xf - 1, yf)),
+                      lerp(fx, grad2(perm[ab], xf, yf - 1), grad2(perm[bb], xf - 1, yf - 1)))
+        
+        total += octave * amp
+        amp_total += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    
+    return total / amp_total
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(name, size):
+    """Load a TrueType font, falling back to PIL's default font (cached per name and size)."""
+    try:
+        return ImageFont.truetype(name, size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+
+def hsv_to_rgb_array(h, s, v):
+    """
+    Convert arrays of HSV colors to RGB.
+    
+    Vectorized equivalent of ``colorsys.hsv_to_rgb`` followed by truncation
+    to 0-255, producing identical values.
+    
+    Args:
+        h: Hue in degrees (scalar or array)
+        s: Saturation 0.0-1.0 (scalar or array)
+        v: Value 0.0-1.0 (scalar or array)
+    
+    Returns:
+        numpy.ndarray: uint8 array of shape ``broadcast(h, s, v).shape + (3,)``
+    """
+    h, s, v = np.broadcast_arrays(np.asarray(h, dtype=np.float64) / 360.0,
+                                  np.asarray(s, dtype=np.float64),
+                                  np.asarray(v, dtype=np.float64))
+    sector = np.trunc(h * 6.0)
+    f = h * 6.0 - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    
+    # Channel sources per sector, in colorsys order
+    candidates = np.stack([v, q, p, t], axis=-1)
+    sector_channels = np.array([[0, 3, 2], [1, 0, 2], [2, 0, 3],
+                                [2, 1, 0], [3, 2, 0], [0, 2, 1]])
+    channels = sector_channels[sector.astype(np.intp) % 6]
+    rgb = np.take_along_axis(candidates, channels, axis=-1)
+    rgb = np.where((s == 0.0)[..., None], v[..., None], rgb)
+    return (rgb * 255).astype(np.uint8)
+
+
 def hsv_to_rgb(h, s, v):
     """Convert HSV color to RGB."""
-    rgb_float = colorsys.hsv_to_rgb(h / 360.0, s, v)
-    return tuple(int(c * 255) for c in rgb_float)
+    return tuple(hsv_to_rgb_array(h, s, v).tolist())
 
 
-def save_jpeg_with_metadata(img, filename):
-    """Save JPEG image with comprehensive EXIF metadata for testing."""
+# Static EXIF fields shared by every generated JPEG; only the dimension
+# tags are filled in per image
+_EXIF_TEMPLATE = {
+    "0th": {
+        piexif.ImageIFD.Software: "Image Test Generator v1.0",
+        piexif.ImageIFD.DateTime: "2025:05:31 12:00:00",
+        piexif.ImageIFD.Orientation: 1,
+        piexif.ImageIFD.XResolution: (72, 1),
+        piexif.ImageIFD.YResolution: (72, 1),
+        piexif.ImageIFD.ResolutionUnit: 2,
+        piexif.ImageIFD.Copyright: "Test Image - No Rights Reserved"
+    },
+    "Exif": {
+        piexif.ExifIFD.ExifVersion: b"0230",
+        piexif.ExifIFD.ColorSpace: 1,
+        piexif.ExifIFD.DateTimeOriginal: "2025:05:31 12:00:00",
+        piexif.ExifIFD.DateTimeDigitized: "2025:05:31 12:00:00",
+        piexif.ExifIFD.FNumber: (56, 10),
+        piexif.ExifIFD.ExposureTime: (1, 125),
+        piexif.ExifIFD.ISOSpeedRatings: 200,
+        piexif.ExifIFD.FocalLength: (50, 1),
+    },
+    "GPS": {
+        piexif.GPSIFD.GPSVersionID: (2, 3, 0, 0),
+        piexif.GPSIFD.GPSLatitudeRef: "N",
+        piexif.GPSIFD.GPSLatitude: [(35, 1), (40, 1), (34, 1)],
+        piexif.GPSIFD.GPSLongitudeRef: "E", 
+        piexif.GPSIFD.GPSLongitude: [(139, 1), (39, 1), (1, 1)],
+        piexif.GPSIFD.GPSAltitudeRef: 0,
+        piexif.GPSIFD.GPSAltitude: (10, 1),
+        piexif.GPSIFD.GPSTimeStamp: [(12, 1), (0, 1), (0, 1)],
+        piexif.GPSIFD.GPSDateStamp: "2025:05:31"
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _exif_bytes(width, height):
+    """Serialize the EXIF template for the given image size (cached per size)."""
     exif_dict = {
         "0th": {
-            piexif.ImageIFD.Software: "Image Test Generator v1.0",
-            piexif.ImageIFD.DateTime: "2025:05:31 12:00:00",
-            piexif.ImageIFD.ImageWidth: img.width,
-            piexif.ImageIFD.ImageLength: img.height,
-            piexif.ImageIFD.Orientation: 1,
-            piexif.ImageIFD.XResolution: (72, 1),
-            piexif.ImageIFD.YResolution: (72, 1),
-            piexif.ImageIFD.ResolutionUnit: 2,
-            piexif.ImageIFD.Copyright: "Test Image - No Rights Reserved"
+            **_EXIF_TEMPLATE["0th"],
+            piexif.ImageIFD.ImageWidth: width,
+            piexif.ImageIFD.ImageLength: height,
         },
         "Exif": {
-            piexif.ExifIFD.ExifVersion: b"0230",
-            piexif.ExifIFD.ColorSpace: 1,
-            piexif.ExifIFD.PixelXDimension: img.width,
-            piexif.ExifIFD.PixelYDimension: img.height,
-            piexif.ExifIFD.DateTimeOriginal: "2025:05:31 12:00:00",
-            piexif.ExifIFD.DateTimeDigitized: "2025:05:31 12:00:00",
-            piexif.ExifIFD.FNumber: (56, 10),
-            piexif.ExifIFD.ExposureTime: (1, 125),
-            piexif.ExifIFD.ISOSpeedRatings: 200,
-            piexif.ExifIFD.FocalLength: (50, 1),
-        },
-        "GPS": {
-            piexif.GPSIFD.GPSVersionID: (2, 3, 0, 0),
-            piexif.GPSIFD.GPSLatitudeRef: "N",
-            piexif.GPSIFD.GPSLatitude: [(35, 1), (40, 1), (34, 1)],
-            piexif.GPSIFD.GPSLongitudeRef: "E", 
-            piexif.GPSIFD.GPSLongitude: [(139, 1), (39, 1), (1, 1)],
-            piexif.GPSIFD.GPSAltitudeRef: 0,
-            piexif.GPSIFD.GPSAltitude: (10, 1),
-            piexif.GPSIFD.GPSTimeStamp: [(12, 1), (0, 1), (0, 1)],
-            piexif.GPSIFD.GPSDateStamp: "2025:05:31"
+            **_EXIF_TEMPLATE["Exif"],
+            piexif.ExifIFD.PixelXDimension: width,
+            piexif.ExifIFD.PixelYDimension: height,
         },
+        "GPS": _EXIF_TEMPLATE["GPS"],
         "1st": {},
         "thumbnail": None
     }
-    
-    exif_bytes = piexif.dump(exif_dict)
+    return piexif.dump(exif_dict)
+
+
+def save_jpeg_with_metadata(img, filename):
+    """Save JPEG image with comprehensive EXIF metadata for testing."""
+    exif_bytes = _exif_bytes(img.width, img.height)
     
     img.save(filename, "JPEG", 
              quality=95,
@@ -329,8 +501,9 @@ def save_jpeg_with_metadata(img, filename):
     print(f"  EXIF data: {len(exif_bytes)} bytes")
 
 
-def save_png_with_metadata(img, filename):
-    """Save PNG image with comprehensive metadata chunks for testing."""
+@functools.lru_cache(maxsize=None)
+def _png_metadata():
+    """Build the constant PNG text chunks once; shared by every save, do not mutate."""
     pnginfo = PngImagePlugin.PngInfo()
     
     pnginfo.add_text("Software", "PNG Test Generator v1.0")
@@ -361,6 +534,13 @@ def save_png_with_metadata(img, filename):
     pnginfo.add_text("Generator", "Python PIL + Custom Code")
     pnginfo.add_text("Purpose", "Format Variation Testing")
     
+    return pnginfo
+
+
+def save_png_with_metadata(img, filename):
+    """Save PNG image with comprehensive metadata chunks for testing."""
+    pnginfo = _png_metadata()
+    
     img.save(filename, "PNG",
              pnginfo=pnginfo,
              optimize=False,
@@ -386,50 +566,66 @@ def create_gif_test_animation(width=200, height=200, frame_count=10):
     """
     frames = []
     
+    # Per-frame animation parameters, evaluated for all frames at once
+    # Animation progress (0.0 to 1.0)
+    if frame_count > 1:
+        progress = np.arange(frame_count) / (frame_count - 1)
+    else:
+        progress = np.zeros(frame_count)
+    wave = np.sin(progress * 4 * np.pi)
+    
+    # Ball position (bounce effect)
+    ball_xs = (30 + (width - 60) * np.abs(2 * progress - 1)).astype(int).tolist()
+    ball_ys = (height // 2 + 30 * wave).astype(int).tolist()
+    
+    # Spinner end points (2 full rotations)
+    center_x, center_y = width // 2, height // 2
+    spinner_length = 25
+    angles = np.radians(progress * 360 * 2)
+    end_xs = (center_x + spinner_length * np.cos(angles)).tolist()
+    end_ys = (center_y + spinner_length * np.sin(angles)).tolist()
+    
+    # Corner square colors, each corner a quarter turn further round the hue wheel
+    hues = (progress * 360) % 360
+    corner_hues = (hues[:, None] + np.arange(4) * 90) % 360
+    corner_rgbs = hsv_to_rgb_array(corner_hues, 0.6, 0.8).tolist()
+    text_alphas = (128 + 127 * wave).astype(int).tolist()
+    bar_widths = ((width - 20) * progress).astype(int).tolist()
+    
+    # Font for the pulsing text, loaded once for all frames
+    try:
+        font = ImageFont.load_default()
+    except OSError:
+        font = None
+    
     for frame_idx in range(frame_count):
         # Create base frame
         img = Image.new('RGBA', (width, height), (50, 50, 50, 255))  # Dark gray background
         draw = ImageDraw.Draw(img)
         
-        # Animation progress (0.0 to 1.0)
-        progress = frame_idx / (frame_count - 1) if frame_count > 1 else 0
-        
         # 1. Moving ball (bouncing)
-        ball_x = int(30 + (width - 60) * abs(2 * progress - 1))  # Bounce effect
-        ball_y = int(height // 2 + 30 * np.sin(progress * 4 * np.pi))
+        ball_x, ball_y = ball_xs[frame_idx], ball_ys[frame_idx]
         draw.ellipse([ball_x - 10, ball_y - 10, ball_x + 10, ball_y + 10], 
                     fill=(255, 100, 100, 255))  # Red ball
         
         # 2. Rotating spinner
-        center_x, center_y = width // 2, height // 2
-        angle = progress * 360 * 2  # 2 full rotations
-        spinner_length = 25
-        end_x = center_x + spinner_length * np.cos(np.radians(angle))
-        end_y = center_y + spinner_length * np.sin(np.radians(angle))
-        draw.line([center_x, center_y, end_x, end_y], fill=(100, 255, 100, 255), width=3)
+        draw.line([center_x, center_y, end_xs[frame_idx], end_ys[frame_idx]],
+                  fill=(100, 255, 100, 255), width=3)
         
         # 3. Color changing background elements
-        hue = (progress * 360) % 360
-        rgb = hsv_to_rgb(hue, 0.8, 0.9)
-        
         # Corner squares with changing colors
-        for corner_idx, (x, y) in enumerate([(10, 10), (width-30, 10), (10, height-30), (width-30, height-30)]):
-            corner_hue = (hue + corner_idx * 90) % 360
-            corner_rgb = hsv_to_rgb(corner_hue, 0.6, 0.8)
+        for corner_rgb, (x, y) in zip(corner_rgbs[frame_idx],
+                                      [(10, 10), (width-30, 10), (10, height-30), (width-30, height-30)]):
             draw.rectangle([x, y, x + 20, y + 20], fill=(*corner_rgb, 255))
         
         # 4. Pulsing text
-        text_alpha = int(128 + 127 * np.sin(progress * 4 * np.pi))
-        try:
-            font = ImageFont.load_default()
-        except:
-            font = None
+        text_alpha = text_alphas[frame_idx]
         
         draw.text((width//2 - 15, height - 25), "GIF", 
                  fill=(255, 255, 255, text_alpha), font=font)
         
         # 5. Progress bar
-        bar_width = int((width - 20) * progress)
+        bar_width = bar_widths[frame_idx]
         draw.rectangle([10, height - 10, 10 + bar_width, height - 5], 
                       fill=(255, 255, 0, 255))
         
@@ -464,21 +660,22 @@ def save_gif_with_options(frames, filename, duration=100, loop=0, optimize=False
     
     # Convert to palette mode if specified
     if palette_size < 256:
-        # Create quantized frames
-        quantized_frames = []
-        for frame in rgba_frames:
-            # Convert RGBA to RGB for quantization
-            if frame.mode == 'RGBA':
-                # Create white background for transparency
-                background = Image.new('RGB', frame.size, (255, 255, 255))
-                background.paste(frame, mask=frame.split()[-1])  # Use alpha as mask
-                frame = background
-            
-            # Quantize to specified palette size
-            quantized = frame.quantize(colors=palette_size, dither=Image.FLOYDSTEINBERG if dither else Image.NONE)
-            quantized_frames.append(quantized)
+        # Composite every frame onto white in one pass (rounded like PIL's
+        # masked paste); the stacked buffer doubles as the palette source
+        stack = np.stack([np.asarray(frame) for frame in rgba_frames])
+        alpha = stack[..., 3:].astype(np.uint16)
+        flattened = ((stack[..., :3] * alpha + 255 * (255 - alpha) + 127) // 255).astype(np.uint8)
+        flattened_frames = [Image.fromarray(frame) for frame in flattened]
+        
+        # Compute one palette over all frames stacked together, then map every
+        # frame onto it so the animation shares a single color table
+        frame_count, height, width = flattened.shape[:3]
+        montage = Image.fromarray(flattened.reshape(frame_count * height, width, 3))
+        palette_ref = montage.quantize(colors=palette_size, method=Image.Quantize.FASTOCTREE)
         
-        save_frames = quantized_frames
+        dither_mode = Image.FLOYDSTEINBERG if dither else Image.NONE
+        save_frames = [frame.quantize(palette=palette_ref, dither=dither_mode)
+                       for frame in flattened_frames]
     else:
         save_frames = rgba_frames
     
@@ -500,6 +697,11 @@ def save_gif_with_options(frames, filename, duration=100, loop=0, optimize=False
     print(f"  File size: {Path(filename).stat().st_size} bytes")
 
 
+def _image_seed(filename):
+    """Derive a fixed random seed from an output filename."""
+    return zlib.crc32(filename.encode('utf-8'))
+
+
 def generate_original_images(output_dir="output"):
     """Generate JPEG, PNG, and GIF test images with ideal specifications."""
     output_path = Path(output_dir)
@@ -508,21 +710,35 @@ def generate_original_images(output_dir="output"):
     print("Generating ideal test images...")
     
     try:
-        # Generate JPEG test image
-        print("\n1. Creating JPEG test image...")
-        jpeg_img = create_jpeg_test_image(width=640, height=480)
         jpeg_path = output_path / "test_original.jpg"
-        save_jpeg_with_metadata(jpeg_img, str(jpeg_path))
-        
-        # Generate PNG test image  
-        print("\n2. Creating PNG test image...")
-        png_img = create_png_test_image(width=480, height=480)
         png_path = output_path / "test_original.png"
-        save_png_with_metadata(png_img, str(png_path))
         
-        # Generate GIF test animation
-        print("\n3. Creating GIF test animation...")
-        gif_frames = create_gif_test_animation(width=200, height=200, frame_count=10)
+        # The three images are independent, so render them concurrently
+        # (NumPy and PIL release the GIL for the heavy work) and save them
+        # in order so the log reads the same as a sequential run. Each image
+        # draws from its own seed, so every run writes the same originals
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            jpeg_future = executor.submit(create_jpeg_test_image, width=640, height=480,
+                                          seed=_image_seed(jpeg_path.name))
+            png_future = executor.submit(create_png_test_image, width=480, height=480,
+                                         seed=_image_seed(png_path.name))
+            gif_future = executor.submit(create_gif_test_animation,
+                                         width=200, height=200, frame_count=10)
+            
+            # Generate JPEG test image
+            print("\n1. Creating JPEG test image...")
+            jpeg_img = jpeg_future.result()
+            save_jpeg_with_metadata(jpeg_img, str(jpeg_path))
+            
+            # Generate PNG test image  
+            print("\n2. Creating PNG test image...")
+            png_img = png_future.result()
+            save_png_with_metadata(png_img, str(png_path))
+            
+            # Generate GIF test animation
+            print("\n3. Creating GIF test animation...")
+            gif_frames = gif_future.result()
+        
         gif_path = output_path / "test_original.gif"
         save_gif_with_options(gif_frames, str(gif_path), duration=100, loop=0, 
                              optimize=False, palette_size=256, dither=True)
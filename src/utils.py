@@ -6,6 +6,9 @@ This module contains common helper functions used across the toolkit.
 
 import os
 import sys
+import time
+import functools
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -18,22 +21,33 @@ def check_dependencies():
         dict: Status of each dependency
     """
     dependencies = {
-        'imagemagick': False,
+        'imagemagick': _imagemagick_available(),
         'python_libs': True  # Assume Python libs are OK if we got this far
     }
     
-    # Check ImageMagick
-    try:
-        result = subprocess.run(['convert', '-version'], 
-                              capture_output=True, text=True, check=True)
-        if 'ImageMagick' in result.stdout:
-            dependencies['imagemagick'] = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        dependencies['imagemagick'] = False
-    
     return dependencies
 
 
+@functools.cache
+def _imagemagick_available():
+    """Probe for ImageMagick once per process."""
+    for cmd in ('magick', 'convert'):
+        # Skip the subprocess entirely when the binary is not on PATH
+        if shutil.which(cmd) is None:
+            continue
+        
+        # 'convert' may be another tool (e.g. on Windows), so check the banner
+        try:
+            result = subprocess.run([cmd, '-version'], 
+                                  capture_output=True, text=True, check=True)
+            if 'ImageMagick' in result.stdout:
+                return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+    
+    return False
+
+
 def print_dependency_status():
     """Print the status of all dependencies."""
     deps = check_dependencies()
@@ -75,17 +89,20 @@ def get_file_size(file_path):
     Get file size in bytes.
     
     Args:
-        file_path (str or Path): Path to file
+        file_path (str, bytes or Path): Path to file
         
     Returns:
         int: File size in bytes, or 0 if file doesn't exist
     """
     try:
-        return Path(file_path).stat().st_size
-    except (OSError, FileNotFoundError):
+        return os.stat(file_path).st_size
+    except OSError:
         return 0
 
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes):
     """
     Format file size in human-readable format.
@@ -99,54 +116,105 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # Each unit step is 10 bits, so the unit follows from the bit length
+    i = min(len(_SIZE_NAMES) - 1, max(0, int(size_bytes).bit_length() - 1) // 10)
     
     if i == 0:
-        return f"{int(size_bytes)}{size_names[i]}"
+        return f"{int(size_bytes)}{_SIZE_NAMES[i]}"
     else:
-        return f"{size_bytes:.1f}{size_names[i]}"
+        return f"{size_bytes / (1 << (10 * i)):.1f}{_SIZE_NAMES[i]}"
+
+
+# Image file extensions recognized by the toolkit (lowercase)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif')
+
+
+# Leading magic bytes of the supported image formats
+_IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',          # JPEG
+    b'\x89PNG\r\n\x1a\n',     # PNG
+    b'GIF87a', b'GIF89a',     # GIF
+    b'BM',                    # BMP
+    b'II*\x00', b'MM\x00*',   # TIFF (little/big endian)
+)
+
+
+def sniff_image_file(file_path):
+    """
+    Cheaply check whether a file starts with a supported image signature.
+    
+    Only the first bytes are read; unlike validate_image_file() the image
+    header itself is not parsed.
+    
+    Args:
+        file_path (str or Path): Path to image file
+        
+    Returns:
+        bool: True if the file header matches a supported format
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    return header.startswith(_IMAGE_SIGNATURES)
 
 
 def validate_image_file(file_path):
     """
     Validate if a file is a supported image format.
     
+    PIL parses the image header (format, size and mode) but does not decode
+    the pixel data, so the check costs a few kilobytes of I/O per file.
+    
     Args:
         file_path (str or Path): Path to image file
         
     Returns:
         bool: True if file is a valid image, False otherwise
     """
-    supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif'}
-    
     path = Path(file_path)
     
-    # Check if file exists
-    if not path.exists():
-        return False
-    
     # Check extension
-    if path.suffix.lower() not in supported_extensions:
+    if path.suffix.lower() not in IMAGE_EXTENSIONS:
         return False
     
-    # Try to open with PIL
+    # Try to open with PIL (a missing file fails here as well)
     try:
         from PIL import Image
         with Image.open(path) as img:
-            img.verify()  # Verify it's a valid image
-        return True
+            return img.width > 0 and img.height > 0
     except Exception:
         return False
 
 
+def _scan_image_files(directory, recursive):
+    """Yield image file paths under a directory using os.scandir entries."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from _scan_image_files(entry.path, recursive)
+                elif (entry.name.lower().endswith(IMAGE_EXTENSIONS) and
+                      entry.is_file() and sniff_image_file(entry.path)):
+                    yield Path(entry.path)
+            except OSError:
+                continue
+
+
 def get_image_files(directory, recursive=True):
     """
     Get all image files in a directory.
     
+    Files are selected by extension and header signature; use
+    validate_image_file() to check that PIL can parse a file.
+    
     Args:
         directory (str or Path): Directory to search
         recursive (bool): Whether to search subdirectories
@@ -154,27 +222,11 @@ def get_image_files(directory, recursive=True):
     Returns:
         list: List of Path objects for image files
     """
-    supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif'}
-    
-    dir_path = Path(directory)
-    
-    if not dir_path.exists():
-        return []
-    
-    image_files = []
-    
-    if recursive:
-        pattern = "**/*"
-    else:
-        pattern = "*"
-    
-    for file_path in dir_path.glob(pattern):
-        if (file_path.is_file() and 
-            file_path.suffix.lower() in supported_extensions and
-            validate_image_file(file_path)):
-            image_files.append(file_path)
-    
-    return sorted(image_files)
+    return sorted(_scan_image_files(directory, recursive))
+
+
+# Characters that are problematic in filenames, each mapped to '_'
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
 
 
 def safe_filename(filename):
@@ -187,12 +239,7 @@ def safe_filename(filename):
     Returns:
         str: Safe filename
     """
-    # Characters that are problematic in filenames
-    unsafe_chars = '<>:"/\\|?*'
-    
-    safe_name = filename
-    for char in unsafe_chars:
-        safe_name = safe_name.replace(char, '_')
+    safe_name = filename.translate(_UNSAFE_FILENAME_CHARS)
     
     # Remove leading/trailing whitespace and dots
     safe_name = safe_name.strip(' .')
@@ -204,6 +251,17 @@ def safe_filename(filename):
     return safe_name
 
 
+# Minimum seconds between progress redraws that leave the bar unchanged
+_PROGRESS_INTERVAL = 0.05
+_progress_state = {'filled': -1, 'time': 0.0}
+
+
+@functools.lru_cache(maxsize=None)
+def _progress_bar(filled_length, length):
+    """Build (and cache) the bar string for a fill level."""
+    return '█' * filled_length + '-' * (length - filled_length)
+
+
 def print_progress(current, total, prefix="Progress", suffix="Complete", length=50):
     """
     Print a progress bar.
@@ -218,14 +276,25 @@ def print_progress(current, total, prefix="Progress", suffix="Complete", length=
     if total <= 0:
         return
     
-    percent = (current / total) * 100
     filled_length = int(length * current // total)
-    bar = '█' * filled_length + '-' * (length - filled_length)
     
-    print(f'\r{prefix} |{bar}| {current}/{total} ({percent:.1f}%) {suffix}', end='')
+    # Skip redraws that would not move the bar within the throttle interval
+    now = time.monotonic()
+    if (current != total and filled_length == _progress_state['filled'] and
+            now - _progress_state['time'] < _PROGRESS_INTERVAL):
+        return
+    _progress_state['filled'] = filled_length
+    _progress_state['time'] = now
+    
+    percent = (current / total) * 100
+    bar = _progress_bar(filled_length, length)
+    
+    sys.stdout.write(f'\r{prefix} |{bar}| {current}/{total} ({percent:.1f}%) {suffix}')
     
     if current == total:
-        print()  # New line when complete
+        sys.stdout.write('\n')  # New line when complete
+        _progress_state['filled'] = -1  # Next bar starts fresh
+    sys.stdout.flush()
 
 
 def log_operation(operation, success=True, details=None):
@@ -8,20 +8,31 @@ the specifications defined in CLAUDE.md.
 import os
 import subprocess
 import json
+import functools
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
+from PIL import Image, JpegImagePlugin, PngImagePlugin
 import tempfile
 import cv2
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional; index.json falls back to the stdlib encoder
+    orjson = None
 
-def generate_variations(source_dir="output", output_dir="output"):
+
+def generate_variations(source_dir="output", output_dir="output", workers=None):
     """
     Generate all specified format variations from source images.
     
     Args:
         source_dir (str): Directory containing source images
         output_dir (str): Output directory for variations
+        workers (int): Concurrent conversions per format, at least 1
+                       (default: Python's ThreadPoolExecutor default, based
+                       on the CPU count)
         
     Returns:
         bool: True if successful, False otherwise
@@ -29,12 +40,6 @@ def generate_variations(source_dir="output", output_dir="output"):
     source_path = Path(source_dir)
     output_path = Path(output_dir)
     
-    # Create output directories
-    jpeg_output = output_path / "jpeg"
-    png_output = output_path / "png"
-    jpeg_output.mkdir(parents=True, exist_ok=True)
-    png_output.mkdir(parents=True, exist_ok=True)
-    
     # Find source images
     jpeg_source = source_path / "test_original.jpg"
     png_source = source_path / "test_original.png"
@@ -52,18 +57,28 @@ def generate_variations(source_dir="output", output_dir="output"):
         print(f"Error: GIF source image not found: {gif_source}")
         return False
     
-    # Create GIF output directory
+    # Create output directories
+    jpeg_output = output_path / "jpeg"
+    png_output = output_path / "png"
     gif_output = output_path / "gif"
-    gif_output.mkdir(parents=True, exist_ok=True)
+    for format_output in (jpeg_output, png_output, gif_output):
+        format_output.mkdir(parents=True, exist_ok=True)
     
-    print("Generating JPEG variations...")
-    jpeg_index = generate_jpeg_variations(str(jpeg_source), str(jpeg_output))
+    # The three formats share nothing until the index is assembled, so they
+    # are generated concurrently; the work is ImageMagick subprocesses and
+    # PIL encoding, which release the GIL. Progress lines may interleave.
+    _detect_imagemagick_cmd()  # resolve once before the workers need it
+    print("Generating JPEG, PNG and GIF variations...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        jpeg_future = executor.submit(generate_jpeg_variations,
+                                      str(jpeg_source), str(jpeg_output), workers)
+        png_future = executor.submit(generate_png_variations,
+                                     str(png_source), str(png_output), workers)
+        gif_future = executor.submit(generate_gif_variations, str(gif_source), str(gif_output))
     
-    print("\nGenerating PNG variations...")
-    png_index = generate_png_variations(str(png_source), str(png_output))
-    
-    print("\nGenerating GIF variations...")
-    gif_index = generate_gif_variations(str(gif_source), str(gif_output))
+    jpeg_index = jpeg_future.result()
+    png_index = png_future.result()
+    gif_index = gif_future.result()
     
     # Generate index.json
     if jpeg_index is not None and png_index is not None and gif_index is not None:
@@ -98,8 +113,13 @@ def generate_variations(source_dir="output", output_dir="output"):
         
         index_file = output_path / "index.json"
         
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(all_variations, f, indent=2, ensure_ascii=False)
+        # orjson writes the same UTF-8, 2-space-indented document much faster
+        if orjson is not None:
+            with open(index_file, 'wb') as f:
+                f.write(orjson.dumps(all_variations, option=orjson.OPT_INDENT_2))
+        else:
+            with open(index_file, 'w', encoding='utf-8') as f:
+                json.dump(all_variations, f, indent=2, ensure_ascii=False)
         
         print(f"\nGenerated index file: {index_file}")
         print(f"Total variations indexed: {len(all_variations)} (including 3 originals)")
@@ -109,7 +129,7 @@ def generate_variations(source_dir="output", output_dir="output"):
         return False
 
 
-def generate_jpeg_variations(source_file, output_dir):
+def generate_jpeg_variations(source_file, output_dir, workers=None):
     """Generate JPEG format variations."""
     try:
         variations_index = []
@@ -166,34 +186,11 @@ def generate_jpeg_variations(source_file, output_dir):
         ]
         
         # Generate variations
+        _run_conversions(source_file, output_dir, jpeg_specs, _JPEG_CONVERTERS,
+                         _convert_jpeg_critical_combinations, workers)
+        
         for param, category, jp_desc, en_desc in jpeg_specs:
-            if category == "colorspace":
-                _convert_jpeg_colorspace(source_file, output_dir, param)
-                filename = f"colorspace_{param}.jpg"
-            elif category == "encoding":
-                _convert_jpeg_encoding(source_file, output_dir, param)
-                filename = f"encoding_{param}.jpg"
-            elif category == "thumbnail":
-                _convert_jpeg_thumbnail(source_file, output_dir, param)
-                filename = f"thumbnail_{param}.jpg"
-            elif category == "quality":
-                _convert_jpeg_quality(source_file, output_dir, param)
-                filename = f"quality_{param}.jpg"
-            elif category == "subsampling":
-                _convert_jpeg_subsampling(source_file, output_dir, param)
-                filename = f"subsampling_{param}.jpg"
-            elif category == "metadata":
-                _convert_jpeg_metadata(source_file, output_dir, param)
-                filename = f"metadata_{param}.jpg"
-            elif category == "icc":
-                _convert_jpeg_icc(source_file, output_dir, param)
-                filename = f"icc_{param}.jpg"
-            elif category == "orientation":
-                _convert_jpeg_orientation(source_file, output_dir, param)
-                filename = f"orientation_{param}.jpg"
-            elif category == "dpi":
-                _convert_jpeg_dpi(source_file, output_dir, param)
-                filename = f"dpi_{param}.jpg"
+            filename = _JPEG_CONVERTERS[category][1].format(param)
             
             # Add to index
             variations_index.append({
@@ -212,8 +209,6 @@ def generate_jpeg_variations(source_file, output_dir):
             ("critical_jfif_exif_dpi.jpg", "JFIF units:1 72DPIとEXIF 200DPIの併存", "JFIF units:1 72DPI with EXIF 200DPI conflict")
         ]
         
-        _convert_jpeg_critical_combinations(source_file, output_dir)
-        
         for filename, jp_desc, en_desc in critical_combinations:
             variations_index.append({
                 "format": "jpeg",
@@ -230,7 +225,7 @@ def generate_jpeg_variations(source_file, output_dir):
         return None
 
 
-def generate_png_variations(source_file, output_dir):
+def generate_png_variations(source_file, output_dir, workers=None):
     """Generate PNG format variations."""
     try:
         variations_index = []
@@ -283,31 +278,11 @@ def generate_png_variations(source_file, output_dir):
         ]
         
         # Generate variations
+        _run_conversions(source_file, output_dir, png_specs, _PNG_CONVERTERS,
+                         _convert_png_critical_combinations, workers)
+        
         for param, category, jp_desc, en_desc in png_specs:
-            if category == "colortype":
-                _convert_png_colortype(source_file, output_dir, param)
-                filename = f"colortype_{param}.png"
-            elif category == "interlace":
-                _convert_png_interlace(source_file, output_dir, param)
-                filename = f"interlace_{param}.png"
-            elif category == "depth":
-                _convert_png_depth(source_file, output_dir, param)
-                filename = f"depth_{param}bit.png"
-            elif category == "compression":
-                _convert_png_compression(source_file, output_dir, param)
-                filename = f"compression_{param}.png"
-            elif category == "alpha":
-                _convert_png_alpha(source_file, output_dir, param)
-                filename = f"alpha_{param}.png"
-            elif category == "filter":
-                _convert_png_filter(source_file, output_dir, param)
-                filename = f"filter_{param}.png"
-            elif category == "metadata":
-                _convert_png_metadata(source_file, output_dir, param)
-                filename = f"metadata_{param}.png"
-            elif category == "chunk":
-                _convert_png_chunks(source_file, output_dir, param)
-                filename = f"chunk_{param}.png"
+            filename = _PNG_CONVERTERS[category][1].format(param)
             
             # Add to index
             variations_index.append({
@@ -325,8 +300,6 @@ def generate_png_variations(source_file, output_dir):
             ("critical_interlace_highres.png", "インターレースと高解像度の組み合わせ", "Interlace with high resolution combination")
         ]
         
-        _convert_png_critical_combinations(source_file, output_dir)
-        
         for filename, jp_desc, en_desc in critical_combinations:
             variations_index.append({
                 "format": "png",
@@ -496,6 +469,137 @@ def generate_gif_variations(source_file, output_dir):
 
 
 # JPEG conversion functions
+
+# EXIF 0th IFD tag ids edited by the variations (same values as piexif.ImageIFD)
+_TAG_ORIENTATION = 0x0112
+_TAG_X_RESOLUTION = 0x011A
+_TAG_Y_RESOLUTION = 0x011B
+_TAG_RESOLUTION_UNIT = 0x0128
+_RESOLUTION_TAGS = (_TAG_X_RESOLUTION, _TAG_Y_RESOLUTION, _TAG_RESOLUTION_UNIT)
+
+# PIL subsampling option values for the subsampling variations
+_PIL_SUBSAMPLING = {"444": 0, "422": 1, "420": 2}
+
+@functools.lru_cache(maxsize=None)
+def _load_exif_cached(path, mtime_ns, size):
+    """Parse a file's EXIF once per file version; None if it has none or is unreadable."""
+    import piexif
+    try:
+        return piexif.load(path)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _decode_source_cached(path, mtime_ns, size):
+    """Decode a source image once per file version."""
+    with Image.open(path) as img:
+        img.load()
+    return img
+
+
+def _open_source_image(source):
+    """
+    Return a private, decoded copy of a source image.
+    
+    Most PIL-based variations re-encode the same source, so it is decoded
+    once and cached. PIL keeps per-save state on the image object and the
+    conversions run concurrently, so every caller gets its own copy, which
+    keeps img.info.
+    
+    Args:
+        source (str): Path to source image
+        
+    Returns:
+        PIL.Image.Image: Decoded copy of the source image
+    """
+    return _cached_source(source).copy()
+
+
+def _cached_source(source):
+    """The shared decoded source image; callers must not modify or save it."""
+    stat = os.stat(source)
+    return _decode_source_cached(str(source), stat.st_mtime_ns, stat.st_size)
+
+
+def _jpeg_source_tables(source):
+    """
+    PIL save options that re-encode a JPEG at the source's own quality.
+    
+    convert keeps the source quality and chroma subsampling when neither
+    -quality nor -sampling-factor is given; reusing the source quantization
+    tables and sampling factors does the same.
+    """
+    cached = _cached_source(source)
+    return {'qtables': getattr(cached, 'quantization', None),
+            'subsampling': JpegImagePlugin.get_sampling(cached)}
+
+
+def _load_or_create_exif(source):
+    """
+    Load a JPEG's EXIF data as a fresh, mutable piexif dict.
+    
+    Several variations start from the same source EXIF, so the parse is cached
+    and each caller receives its own copy of the IFD dicts.
+    
+    Args:
+        source (str): Path to source JPEG
+        
+    Returns:
+        dict: piexif-style dict; empty IFDs if the source has no EXIF
+    """
+    try:
+        stat = os.stat(source)
+        exif_data = _load_exif_cached(str(source), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        exif_data = None
+    
+    if exif_data is None:
+        return {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+    return {key: dict(value) if isinstance(value, dict) else value
+            for key, value in exif_data.items()}
+
+
+def _jpeg_metadata_options(img, strip=False):
+    """
+    PIL save options that keep a source JPEG's metadata, as ImageMagick does.
+    
+    The EXIF block and ICC profile are copied unchanged unless strip is set
+    (like -strip); the JFIF density is only carried over when it has
+    physical units, since PIL always writes an explicit dpi with inch units.
+    """
+    options = {}
+    if not strip:
+        options = {key: img.info[key] for key in ('exif', 'icc_profile') if img.info.get(key)}
+    if img.info.get('jfif_unit') in (1, 2) and 'dpi' in img.info:
+        options['dpi'] = img.info['dpi']
+    return options
+
+
+def _reencode_jpeg(source, output_file, convert_options, strip=False, **save_options):
+    """
+    Re-encode a JPEG source in-process with PIL, falling back to convert.
+    
+    With no save options this reproduces a plain convert of the source:
+    same quantization tables, chroma subsampling and metadata.
+    
+    Args:
+        source (str): Path to source JPEG
+        output_file (str): Output JPEG path
+        convert_options (list): Equivalent convert options for the fallback
+        strip (bool): Drop EXIF and ICC metadata, like -strip
+        **save_options: PIL JPEG save options overriding the defaults
+    """
+    try:
+        with _open_source_image(source) as img:
+            options = {**_jpeg_source_tables(source),
+                       **_jpeg_metadata_options(img, strip), **save_options}
+            img.save(output_file, "JPEG", **options)
+    except Exception as e:
+        print(f"PIL re-encoding failed, using ImageMagick fallback: {e}")
+        _run_imagemagick_command(["convert", source, *convert_options, output_file])
+
+
 def _convert_jpeg_colorspace(source, output_dir, colorspace):
     """Convert JPEG to different color spaces."""
     output_file = os.path.join(output_dir, f"colorspace_{colorspace}.jpg")
@@ -514,12 +618,10 @@ def _convert_jpeg_encoding(source, output_dir, encoding):
     """Convert JPEG encoding format."""
     output_file = os.path.join(output_dir, f"encoding_{encoding}.jpg")
     
-    if encoding == "baseline":
-        cmd = ["convert", source, "-interlace", "none", output_file]
-    elif encoding == "progressive":
-        cmd = ["convert", source, "-interlace", "JPEG", output_file]
-    
-    _run_imagemagick_command(cmd)
+    if encoding == "progressive":
+        _reencode_jpeg(source, output_file, ["-interlace", "JPEG"], progressive=True)
+    else:
+        _reencode_jpeg(source, output_file, ["-interlace", "none"])
 
 
 def _convert_jpeg_thumbnail(source, output_dir, thumbnail):
@@ -527,8 +629,7 @@ def _convert_jpeg_thumbnail(source, output_dir, thumbnail):
     output_file = os.path.join(output_dir, f"thumbnail_{thumbnail}.jpg")
     
     if thumbnail == "none":
-        cmd = ["convert", source, "-strip", output_file]
-        _run_imagemagick_command(cmd)
+        _reencode_jpeg(source, output_file, ["-strip"], strip=True)
     elif thumbnail == "embedded":
         # Simplified approach - create a copy with embedded thumbnail
         # Use PIL to create thumbnail in EXIF data
@@ -541,10 +642,7 @@ def _convert_jpeg_thumbnail(source, output_dir, thumbnail):
                 img.thumbnail((160, 120), Image.Resampling.LANCZOS)
                 
                 # Load existing EXIF or create new
-                try:
-                    exif_data = piexif.load(str(source))
-                except:
-                    exif_data = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+                exif_data = _load_or_create_exif(source)
                 
                 # Convert thumbnail to JPEG bytes
                 import io
@@ -553,7 +651,7 @@ def _convert_jpeg_thumbnail(source, output_dir, thumbnail):
                 exif_data["thumbnail"] = thumb_buffer.getvalue()
                 
                 # Save original image with embedded thumbnail
-                with Image.open(source) as orig_img:
+                with _open_source_image(source) as orig_img:
                     exif_bytes = piexif.dump(exif_data)
                     orig_img.save(output_file, "JPEG", quality=95, exif=exif_bytes)
                     
@@ -570,22 +668,26 @@ def _convert_jpeg_thumbnail(source, output_dir, thumbnail):
 def _convert_jpeg_quality(source, output_dir, quality):
     """Convert JPEG with different quality settings."""
     output_file = os.path.join(output_dir, f"quality_{quality}.jpg")
-    cmd = ["convert", source, "-quality", str(quality), output_file]
-    _run_imagemagick_command(cmd)
+    
+    # Re-encode in-process with Pillow's libjpeg-turbo instead of a convert
+    # process; like ImageMagick, chroma is only left unsubsampled from 90 up
+    try:
+        with _open_source_image(source) as img:
+            img.save(output_file, "JPEG", quality=quality,
+                     subsampling=0 if quality >= 90 else 2,
+                     **_jpeg_metadata_options(img))
+    except Exception as e:
+        print(f"PIL quality encoding failed, using ImageMagick fallback: {e}")
+        cmd = ["convert", source, "-quality", str(quality), output_file]
+        _run_imagemagick_command(cmd)
 
 
 def _convert_jpeg_subsampling(source, output_dir, subsampling):
     """Convert JPEG with different subsampling."""
     output_file = os.path.join(output_dir, f"subsampling_{subsampling}.jpg")
     
-    if subsampling == "444":
-        cmd = ["convert", source, "-sampling-factor", "4:4:4", output_file]
-    elif subsampling == "422":
-        cmd = ["convert", source, "-sampling-factor", "4:2:2", output_file]
-    elif subsampling == "420":
-        cmd = ["convert", source, "-sampling-factor", "4:2:0", output_file]
-    
-    _run_imagemagick_command(cmd)
+    _reencode_jpeg(source, output_file, ["-sampling-factor", ":".join(subsampling)],
+                   subsampling=_PIL_SUBSAMPLING[subsampling])
 
 
 def _convert_jpeg_metadata(source, output_dir, metadata):
@@ -593,17 +695,16 @@ def _convert_jpeg_metadata(source, output_dir, metadata):
     output_file = os.path.join(output_dir, f"metadata_{metadata}.jpg")
     
     if metadata == "none":
-        cmd = ["convert", source, "-strip", output_file]
+        _reencode_jpeg(source, output_file, ["-strip"], strip=True)
     elif metadata == "basic_exif":
         # Keep some basic EXIF but remove GPS and complex data
         cmd = ["convert", source, "-define", "jpeg:preserve-settings", 
                "-set", "exif:Software", "Test Generator", 
                "-set", "exif:DateTime", "2025:05:31 12:00:00", output_file]
+        _run_imagemagick_command(cmd)
     else:
         # Keep original metadata for gps and full_exif
-        cmd = ["convert", source, output_file]
-    
-    _run_imagemagick_command(cmd)
+        _reencode_jpeg(source, output_file, [])
 
 
 def _convert_jpeg_icc(source, output_dir, icc):
@@ -675,19 +776,15 @@ def _convert_jpeg_orientation(source, output_dir, orientation):
     
     # Use PIL with piexif to set EXIF orientation tag more reliably
     try:
-        from PIL import Image
         import piexif
         
         # Copy the source image first
-        with Image.open(source) as img:
+        with _open_source_image(source) as img:
             # Load existing EXIF data or create new
-            try:
-                exif_data = piexif.load(str(source))
-            except:
-                exif_data = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+            exif_data = _load_or_create_exif(source)
             
             # Set orientation tag
-            exif_data["0th"][piexif.ImageIFD.Orientation] = orientation
+            exif_data["0th"][_TAG_ORIENTATION] = orientation
             
             # Convert back to bytes
             exif_bytes = piexif.dump(exif_data)
@@ -707,49 +804,42 @@ def _convert_jpeg_dpi(source, output_dir, dpi_type):
     output_file = os.path.join(output_dir, f"dpi_{dpi_type}.jpg")
     
     try:
-        from PIL import Image
         import piexif
         
-        with Image.open(source) as img:
+        with _open_source_image(source) as img:
             # Load existing EXIF data or create new
-            try:
-                exif_data = piexif.load(str(source))
-            except:
-                exif_data = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+            exif_data = _load_or_create_exif(source)
             
             if dpi_type == "jfif_units0":
                 # JFIF units:0 (aspect ratio only, no absolute DPI)
                 # Remove resolution info from EXIF and set JFIF to units=0
-                exif_data["0th"].pop(piexif.ImageIFD.XResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.YResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.ResolutionUnit, None)
+                for tag in _RESOLUTION_TAGS:
+                    exif_data["0th"].pop(tag, None)
                 
                 exif_bytes = piexif.dump(exif_data)
                 img.save(output_file, "JPEG", quality=95, exif=exif_bytes, dpi=(1, 1))  # PIL sets JFIF units=0 for 1:1
                 
             elif dpi_type == "jfif_72dpi":
                 # JFIF units:1 with 72 DPI
-                exif_data["0th"].pop(piexif.ImageIFD.XResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.YResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.ResolutionUnit, None)
+                for tag in _RESOLUTION_TAGS:
+                    exif_data["0th"].pop(tag, None)
                 
                 exif_bytes = piexif.dump(exif_data)
                 img.save(output_file, "JPEG", quality=95, exif=exif_bytes, dpi=(72, 72))
                 
             elif dpi_type == "jfif_200dpi":
                 # JFIF units:1 with 200 DPI
-                exif_data["0th"].pop(piexif.ImageIFD.XResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.YResolution, None)
-                exif_data["0th"].pop(piexif.ImageIFD.ResolutionUnit, None)
+                for tag in _RESOLUTION_TAGS:
+                    exif_data["0th"].pop(tag, None)
                 
                 exif_bytes = piexif.dump(exif_data)
                 img.save(output_file, "JPEG", quality=95, exif=exif_bytes, dpi=(200, 200))
                 
             elif dpi_type == "exif_72dpi":
                 # EXIF specified 72 DPI (no JFIF resolution)
-                exif_data["0th"][piexif.ImageIFD.XResolution] = (72, 1)
-                exif_data["0th"][piexif.ImageIFD.YResolution] = (72, 1)
-                exif_data["0th"][piexif.ImageIFD.ResolutionUnit] = 2  # inches
+                exif_data["0th"][_TAG_X_RESOLUTION] = (72, 1)
+                exif_data["0th"][_TAG_Y_RESOLUTION] = (72, 1)
+                exif_data["0th"][_TAG_RESOLUTION_UNIT] = 2  # inches
                 
                 exif_bytes = piexif.dump(exif_data)
                 # Save without DPI parameter to avoid JFIF resolution
@@ -757,9 +847,9 @@ def _convert_jpeg_dpi(source, output_dir, dpi_type):
                 
             elif dpi_type == "exif_200dpi":
                 # EXIF specified 200 DPI (no JFIF resolution)
-                exif_data["0th"][piexif.ImageIFD.XResolution] = (200, 1)
-                exif_data["0th"][piexif.ImageIFD.YResolution] = (200, 1)
-                exif_data["0th"][piexif.ImageIFD.ResolutionUnit] = 2  # inches
+                exif_data["0th"][_TAG_X_RESOLUTION] = (200, 1)
+                exif_data["0th"][_TAG_Y_RESOLUTION] = (200, 1)
+                exif_data["0th"][_TAG_RESOLUTION_UNIT] = 2  # inches
                 
                 exif_bytes = piexif.dump(exif_data)
                 # Save without DPI parameter to avoid JFIF resolution
@@ -786,28 +876,22 @@ def _convert_jpeg_critical_combinations(source, output_dir):
     
     # Progressive + Full Metadata
     output_file = os.path.join(output_dir, "critical_progressive_fullmeta.jpg")
-    cmd = ["convert", source, "-interlace", "JPEG", output_file]
-    _run_imagemagick_command(cmd)
+    _reencode_jpeg(source, output_file, ["-interlace", "JPEG"], progressive=True)
     
     # Thumbnail + Progressive
     output_file = os.path.join(output_dir, "critical_thumbnail_progressive.jpg")
-    cmd = ["convert", source, "-interlace", "JPEG", output_file]
-    _run_imagemagick_command(cmd)
+    _reencode_jpeg(source, output_file, ["-interlace", "JPEG"], progressive=True)
     
     # Orientation + Metadata
     output_file = os.path.join(output_dir, "critical_orientation_metadata.jpg")
     try:
-        from PIL import Image
         import piexif
         
-        with Image.open(source) as img:
-            try:
-                exif_data = piexif.load(str(source))
-            except:
-                exif_data = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+        with _open_source_image(source) as img:
+            exif_data = _load_or_create_exif(source)
             
             # Set orientation to 6 (90 degrees clockwise)
-            exif_data["0th"][piexif.ImageIFD.Orientation] = 6
+            exif_data["0th"][_TAG_ORIENTATION] = 6
             exif_bytes = piexif.dump(exif_data)
             img.save(output_file, "JPEG", quality=95, exif=exif_bytes)
             
@@ -819,19 +903,15 @@ def _convert_jpeg_critical_combinations(source, output_dir):
     # JFIF 72DPI + EXIF 200DPI conflict
     output_file = os.path.join(output_dir, "critical_jfif_exif_dpi.jpg")
     try:
-        from PIL import Image
         import piexif
         
-        with Image.open(source) as img:
-            try:
-                exif_data = piexif.load(str(source))
-            except:
-                exif_data = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+        with _open_source_image(source) as img:
+            exif_data = _load_or_create_exif(source)
             
             # Set EXIF resolution to 200 DPI
-            exif_data["0th"][piexif.ImageIFD.XResolution] = (200, 1)
-            exif_data["0th"][piexif.ImageIFD.YResolution] = (200, 1)
-            exif_data["0th"][piexif.ImageIFD.ResolutionUnit] = 2  # inches
+            exif_data["0th"][_TAG_X_RESOLUTION] = (200, 1)
+            exif_data["0th"][_TAG_Y_RESOLUTION] = (200, 1)
+            exif_data["0th"][_TAG_RESOLUTION_UNIT] = 2  # inches
             
             exif_bytes = piexif.dump(exif_data)
             # Save with JFIF 72 DPI (conflicts with EXIF 200 DPI)
@@ -951,15 +1031,42 @@ def _convert_png_chunks(source, output_dir, chunk):
     """Convert PNG auxiliary chunks."""
     output_file = os.path.join(output_dir, f"chunk_{chunk}.png")
     
-    if chunk == "gamma":
-        cmd = ["convert", source, "-gamma", "2.2", output_file]
-    elif chunk == "background":
-        cmd = ["convert", source, "-background", "white", output_file]
-    else:
-        # Default for transparency or other chunks
-        cmd = ["convert", source, output_file]
-    
-    _run_imagemagick_command(cmd)
+    # A plain convert of the RGBA source writes neither gAMA nor tRNS, so the
+    # chunks are written explicitly with PIL, keeping the source text chunks
+    try:
+        with _open_source_image(source) as img:
+            pnginfo = PngImagePlugin.PngInfo()
+            for key, value in img.info.items():
+                if isinstance(value, str):
+                    pnginfo.add_text(key, value)
+            
+            if chunk == "gamma":
+                # Gamma-encode the color bands like -gamma 2.2 and record 1/2.2
+                encode = [round(255 * (i / 255) ** (1 / 2.2)) for i in range(256)]
+                pnginfo.add(b"gAMA", struct.pack(">I", 45455))
+                with img.point(encode * 3 + list(range(256))) as encoded:
+                    encoded.save(output_file, "PNG", pnginfo=pnginfo)
+            elif chunk == "background":
+                pnginfo.add(b"bKGD", struct.pack(">HHH", 255, 255, 255))
+                img.save(output_file, "PNG", pnginfo=pnginfo)
+            else:
+                # tRNS replaces the alpha channel: flatten onto white and key white out
+                with Image.new("RGB", img.size, (255, 255, 255)) as flat:
+                    flat.paste(img, mask=img.getchannel("A"))
+                    flat.save(output_file, "PNG", pnginfo=pnginfo,
+                              transparency=(255, 255, 255))
+    except Exception as e:
+        print(f"PIL chunk writing failed, using ImageMagick fallback: {e}")
+        if chunk == "gamma":
+            cmd = ["convert", source, "-gamma", "2.2", "-define", "png:include-chunk=gAMA",
+                   output_file]
+        elif chunk == "background":
+            cmd = ["convert", source, "-background", "white", output_file]
+        else:
+            # PNG24 stores binary transparency as a tRNS color key
+            cmd = ["convert", source, "-background", "white", "-alpha", "remove",
+                   "-transparent", "white", f"PNG24:{output_file}"]
+        _run_imagemagick_command(cmd)
 
 
 def _convert_png_critical_combinations(source, output_dir):
@@ -986,38 +1093,91 @@ def _convert_png_critical_combinations(source, output_dir):
     _run_imagemagick_command(cmd)
 
 
-# Global variable to cache detected ImageMagick command
-_imagemagick_cmd = None
+# Variation category to (converter, output filename pattern)
+_JPEG_CONVERTERS = {
+    "colorspace": (_convert_jpeg_colorspace, "colorspace_{}.jpg"),
+    "encoding": (_convert_jpeg_encoding, "encoding_{}.jpg"),
+    "thumbnail": (_convert_jpeg_thumbnail, "thumbnail_{}.jpg"),
+    "quality": (_convert_jpeg_quality, "quality_{}.jpg"),
+    "subsampling": (_convert_jpeg_subsampling, "subsampling_{}.jpg"),
+    "metadata": (_convert_jpeg_metadata, "metadata_{}.jpg"),
+    "icc": (_convert_jpeg_icc, "icc_{}.jpg"),
+    "orientation": (_convert_jpeg_orientation, "orientation_{}.jpg"),
+    "dpi": (_convert_jpeg_dpi, "dpi_{}.jpg"),
+}
+
+_PNG_CONVERTERS = {
+    "colortype": (_convert_png_colortype, "colortype_{}.png"),
+    "interlace": (_convert_png_interlace, "interlace_{}.png"),
+    "depth": (_convert_png_depth, "depth_{}bit.png"),
+    "compression": (_convert_png_compression, "compression_{}.png"),
+    "alpha": (_convert_png_alpha, "alpha_{}.png"),
+    "filter": (_convert_png_filter, "filter_{}.png"),
+    "metadata": (_convert_png_metadata, "metadata_{}.png"),
+    "chunk": (_convert_png_chunks, "chunk_{}.png"),
+}
+
+
+def _run_conversions(source_file, output_dir, specs, converters, critical_converter, workers):
+    """
+    Run every conversion of one format concurrently.
+    
+    Each conversion reads the same source and writes its own output file,
+    and the work is ImageMagick subprocesses and PIL encoding, so the
+    conversions run on a thread pool. The first exception raised by a
+    conversion is re-raised once all of them have finished.
+    
+    Args:
+        source_file (str): Path to source image
+        output_dir (str): Output directory for variations
+        specs (list): (param, category, jp_desc, en_desc) variation specs
+        converters (dict): Category to (converter, filename pattern)
+        critical_converter (callable): Generator for the critical combinations
+        workers (int): Maximum concurrent conversions, at least 1 (None for
+                       the ThreadPoolExecutor default)
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(converters[category][0], source_file, output_dir, param)
+                   for param, category, _, _ in specs]
+        futures.append(executor.submit(critical_converter, source_file, output_dir))
+    
+    for future in futures:
+        future.result()
+
+
+@functools.cache
+def _detect_imagemagick_cmd():
+    """Detect the ImageMagick command once per process; None if not installed."""
+    # Try both 'magick' and 'convert' commands
+    for test_cmd in ['magick', 'convert']:
+        try:
+            subprocess.run([test_cmd, '--version'], stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=True)
+            print(f"Detected ImageMagick command: {test_cmd}")
+            return test_cmd
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+    return None
+
 
 def _run_imagemagick_command(cmd):
     """Run ImageMagick command with error handling."""
-    global _imagemagick_cmd
+    imagemagick_cmd = _detect_imagemagick_cmd()
+    if imagemagick_cmd is None:
+        print("ImageMagick not found. Please install ImageMagick.")
+        return False
     
-    # Detect and cache ImageMagick command if not already done
-    if _imagemagick_cmd is None:
-        # Try both 'magick' and 'convert' commands
-        for test_cmd in ['magick', 'convert']:
-            try:
-                subprocess.run([test_cmd, '--version'], capture_output=True, check=True)
-                _imagemagick_cmd = test_cmd
-                print(f"Detected ImageMagick command: {_imagemagick_cmd}")
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        
-        if _imagemagick_cmd is None:
-            print("ImageMagick not found. Please install ImageMagick.")
-            return False
+    # Replace command with detected ImageMagick command
+    cmd = [imagemagick_cmd, *cmd[1:]]
     
+    # Output files are named on the command line, so stdout is discarded and
+    # stderr is only decoded when the command fails
     try:
-        # Replace command with detected ImageMagick command
-        cmd[0] = _imagemagick_cmd
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"ImageMagick command failed: {' '.join(cmd)}")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e.stderr.decode(errors='replace')}")
         return False
     except FileNotFoundError:
         print("ImageMagick not found. Please install ImageMagick.")
@@ -1041,17 +1201,21 @@ def _create_16bit_png_opencv(source_file, output_file):
     # Convert to 16-bit and add sub-pixel detail for true 16-bit depth
     if img.dtype == np.uint8:
         # Scale 8-bit (0-255) to 16-bit (0-65535)
-        img_16bit = img.astype(np.uint16) * 257  # 257 = 65535/255
+        img_16bit = img.astype(np.uint16)
+        img_16bit *= 257  # 257 = 65535/255
         
         # Add fine-grained noise to utilize the additional bit depth
         # This creates genuine 16-bit content that can't be represented in 8-bit
-        height, width = img_16bit.shape[:2]
         
         # Generate sub-pixel noise (small values that affect only lower bits)
-        noise = np.random.randint(-128, 129, img_16bit.shape, dtype=np.int16)
+        noise = np.random.default_rng().integers(-128, 129, img.shape, dtype=np.int16)
         
-        # Apply noise and clamp to valid 16-bit range
-        img_16bit = np.clip(img_16bit.astype(np.int32) + noise, 0, 65535).astype(np.uint16)
+        # Apply noise in place with wrapping 16-bit addition, then clamp. Only
+        # black and white samples can leave the range: 1*257 - 128 > 0 and
+        # 254*257 + 128 < 65535
+        img_16bit += noise.view(np.uint16)
+        img_16bit[(img == 0) & (noise < 0)] = 0
+        img_16bit[(img == 255) & (noise > 0)] = 65535
     else:
         img_16bit = img.astype(np.uint16)
     
@@ -1065,6 +1229,17 @@ def _create_16bit_png_opencv(source_file, output_file):
     print(f"Created true 16-bit PNG using OpenCV: {output_file}")
 
 
+def _count_files(directory, suffix):
+    """Count regular files with the given suffix in one os.scandir pass (0 if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries
+                       if entry.name.endswith(suffix) and not entry.name.startswith('.')
+                       and entry.is_file())
+    except FileNotFoundError:
+        return 0
+
+
 def test_variation_compliance(output_dir="output"):
     """Test if generated variations meet specifications."""
     output_path = Path(output_dir)
@@ -1075,8 +1250,8 @@ def test_variation_compliance(output_dir="output"):
     print("Testing variation compliance...")
     
     # Count generated files
-    jpeg_count = len(list(jpeg_dir.glob("*.jpg"))) if jpeg_dir.exists() else 0
-    png_count = len(list(png_dir.glob("*.png"))) if png_dir.exists() else 0
+    jpeg_count = _count_files(jpeg_dir, ".jpg")
+    png_count = _count_files(png_dir, ".png")
     
     print(f"\nGenerated variations:")
     print(f"  JPEG variations: {jpeg_count}")
@@ -12,6 +12,9 @@ from pathlib import Path
 from PIL import Image
 import sys
 import os
+import struct
+import zlib
+import piexif
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -19,6 +22,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from src.image_generator import generate_original_images
 from src.variation_generator import generate_variations
 from src.variation_validator import validate_all_variations, validate_jpeg_file, validate_png_file, ValidationResult
+from src.variation_validator import _read_exif_summary, _parse_jpeg_header, _read_png_header
 
 
 class TestDetailedJPEGValidation:
@@ -634,5 +638,258 @@ class TestFileSystemValidation:
         assert pass_rate >= 0.85, f"Pass rate should be at least 85%, got {pass_rate:.1%}"
 
 
+
+def _build_exif(endian, ifd0, exif=(), ifd1=None):
+    """
+    Assemble an EXIF TIFF block for the parser tests.
+    
+    Entries are (tag, type, value) with type 3 (SHORT), 4 (LONG) or
+    5 (RATIONAL, value as (num, den)). The block holds IFD0, then the Exif
+    IFD (linked from IFD0 when given), then IFD1 (linked as IFD0's next IFD
+    when given), then the rational values.
+    """
+    ifd0 = list(ifd0)
+    if exif:
+        ifd0.append((piexif.ImageIFD.ExifTag, 4, 0))  # offset patched below
+    ifds = [ifd0] + ([list(exif)] if exif else []) + ([list(ifd1)] if ifd1 is not None else [])
+    
+    offsets = []
+    position = 8
+    for entries in ifds:
+        offsets.append(position)
+        position += 2 + 12 * len(entries) + 4
+    if exif:
+        ifd0[-1] = (piexif.ImageIFD.ExifTag, 4, offsets[1])
+    
+    body = b''
+    data = b''
+    for index, entries in enumerate(ifds):
+        body += struct.pack(endian + 'H', len(entries))
+        for tag, value_type, value in entries:
+            if value_type == 5:
+                field = struct.pack(endian + 'L', position + len(data))
+                data += struct.pack(endian + 'LL', *value)
+            elif value_type == 3:
+                field = struct.pack(endian + 'H', value) + b'\0\0'
+            else:
+                field = struct.pack(endian + 'L', value)
+            body += struct.pack(endian + 'HHL', tag, value_type, 1) + field
+        next_ifd = offsets[-1] if index == 0 and ifd1 is not None else 0
+        body += struct.pack(endian + 'L', next_ifd)
+    
+    byte_order = b'II' if endian == '<' else b'MM'
+    return byte_order + struct.pack(endian + 'HL', 42, 8) + body + data
+
+
+class TestExifReader:
+    """Unit tests for the TIFF IFD walker that replaced piexif.load."""
+    
+    IFD0 = [
+        (piexif.ImageIFD.Orientation, 3, 6),
+        (piexif.ImageIFD.XResolution, 5, (200, 1)),
+        (piexif.ImageIFD.YResolution, 5, (200, 1)),
+        (piexif.ImageIFD.ResolutionUnit, 3, 2),
+        (0xC000, 4, 1),  # unknown tag, not counted (piexif drops it too)
+    ]
+    EXIF = [
+        (piexif.ExifIFD.ExposureTime, 5, (1, 125)),
+        (piexif.ExifIFD.ISOSpeedRatings, 3, 100),
+    ]
+    IFD1 = [
+        (piexif.ImageIFD.JPEGInterchangeFormat, 4, 0),
+        (piexif.ImageIFD.JPEGInterchangeFormatLength, 4, 0),
+    ]
+    
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_byte_orders(self, endian):
+        """Test that little-endian (II) and big-endian (MM) blocks read the same."""
+        tiff = _build_exif(endian, self.IFD0, self.EXIF, self.IFD1)
+        summary = _read_exif_summary(tiff)
+        
+        assert summary['ifd0'][piexif.ImageIFD.Orientation] == 6
+        assert summary['ifd0'][piexif.ImageIFD.XResolution] == (200, 1)
+        assert summary['ifd0'][piexif.ImageIFD.ResolutionUnit] == 2
+        assert summary['has_gps'] is False
+        assert summary['has_thumbnail'] is True
+        
+        # Tag count agrees with what piexif.load keeps from IFD0 and the Exif IFD
+        loaded = piexif.load(b'Exif\0\0' + tiff)
+        assert summary['tag_count'] == len(loaded['0th']) + len(loaded['Exif'])
+    
+    def test_missing_ifd1(self):
+        """Test a block without IFD1 reports no thumbnail."""
+        summary = _read_exif_summary(_build_exif('<', self.IFD0, self.EXIF))
+        
+        assert summary['has_thumbnail'] is False
+        assert summary['tag_count'] == 7  # 4 known IFD0 tags, ExifTag, 2 Exif tags
+    
+    def test_ifd_offset_past_end(self):
+        """Test that an IFD pointer past the end of the block raises ValueError."""
+        ifd0 = self.IFD0 + [(piexif.ImageIFD.GPSTag, 4, 10000)]
+        with pytest.raises(ValueError):
+            _read_exif_summary(_build_exif('>', ifd0))
+    
+    def test_truncated_block(self):
+        """Test that a block cut inside IFD0 raises ValueError."""
+        tiff = _build_exif('<', self.IFD0, self.EXIF, self.IFD1)
+        with pytest.raises(ValueError):
+            _read_exif_summary(tiff[:30])
+    
+    def test_invalid_byte_order(self):
+        """Test that a block without an II/MM byte order mark raises ValueError."""
+        tiff = _build_exif('<', self.IFD0)
+        with pytest.raises(ValueError):
+            _read_exif_summary(b'XX' + tiff[2:])
+    
+    def test_no_exif(self):
+        """Test that a missing EXIF block reads as empty."""
+        summary = _read_exif_summary(None)
+        
+        assert summary['tag_count'] == 0
+        assert summary['has_gps'] is False
+        assert summary['has_thumbnail'] is False
+
+
+
+def _jpeg_segment(marker, payload):
+    """Encode one JPEG marker segment with its length field."""
+    return bytes([0xFF, marker]) + struct.pack('>H', len(payload) + 2) + payload
+
+
+def _build_jpeg_header(luma_sampling=0x22, layers=3, fill=b''):
+    """
+    Assemble a JPEG header up to the start of scan for the parser tests.
+    
+    Holds a JFIF APP0 at 72 dpi and a baseline SOF0 for a 16x8 image whose
+    first component uses luma_sampling and the others 1x1; fill is inserted
+    before the SOF0 marker.
+    """
+    jfif = b'JFIF\0' + bytes([1, 1, 1]) + struct.pack('>HH', 72, 72) + b'\0\0'
+    components = b''.join(bytes([index + 1, luma_sampling if index == 0 else 0x11, 0])
+                          for index in range(layers))
+    sof = bytes([8]) + struct.pack('>HH', 8, 16) + bytes([layers]) + components
+    return (b'\xff\xd8' + _jpeg_segment(0xE0, jfif) + fill +
+            _jpeg_segment(0xC0, sof) + _jpeg_segment(0xDA, b'\0' * 8))
+
+
+class TestJpegHeaderParser:
+    """Unit tests for the JPEG marker walker that replaced PIL's header parse."""
+    
+    @pytest.mark.parametrize("luma_sampling, expected", [
+        (0x11, '4:4:4'),
+        (0x21, '4:2:2'),
+        (0x22, '4:2:0'),
+    ])
+    def test_subsampling(self, luma_sampling, expected):
+        """Test chroma subsampling from the frame header's sampling factors."""
+        header = _parse_jpeg_header(_build_jpeg_header(luma_sampling))
+        
+        assert header['mode'] == 'RGB'
+        assert header['subsampling'] == expected
+        assert header['jfif_dpi'] == (72, 72)
+        assert header['exif'] is None
+        assert header['has_icc_profile'] is False
+    
+    def test_grayscale(self):
+        """Test that a single-layer frame is reported as L without subsampling."""
+        header = _parse_jpeg_header(_build_jpeg_header(0x11, layers=1))
+        
+        assert header['mode'] == 'L'
+        assert header['subsampling'] is None
+    
+    def test_fill_bytes(self):
+        """Test that 0xFF fill bytes before a marker are skipped."""
+        header = _parse_jpeg_header(_build_jpeg_header(0x21, fill=b'\xff\xff\xff'))
+        
+        assert header['subsampling'] == '4:2:2'
+    
+    def test_truncated_sof(self):
+        """Test that data ending inside the SOF segment raises SyntaxError."""
+        data = _build_jpeg_header()
+        sof_start = data.index(b'\xff\xc0')
+        with pytest.raises(SyntaxError):
+            _parse_jpeg_header(data[:sof_start + 12])
+    
+    def test_short_sof_length(self):
+        """Test that an SOF whose length omits component entries raises SyntaxError."""
+        sof = bytes([8]) + struct.pack('>HH', 8, 16) + bytes([3]) + bytes([1, 0x22, 0])
+        data = b'\xff\xd8' + _jpeg_segment(0xC0, sof) + _jpeg_segment(0xDA, b'\0' * 8)
+        with pytest.raises(SyntaxError):
+            _parse_jpeg_header(data)
+    
+    def test_not_a_jpeg(self):
+        """Test that data without an SOI marker raises SyntaxError."""
+        with pytest.raises(SyntaxError):
+            _parse_jpeg_header(b'\x89PNG\r\n\x1a\n')
+
+
+
+def _png_chunk(chunk_type, data):
+    """Encode one PNG chunk with its length and CRC."""
+    return (struct.pack('>I', len(data)) + chunk_type + data +
+            struct.pack('>I', zlib.crc32(chunk_type + data)))
+
+
+def _build_png(chunks_after_idat=(), interlace=0):
+    """Assemble a 2x2 8-bit RGB PNG with extra chunks between IDAT and IEND."""
+    ihdr = struct.pack('>IIBBBBB', 2, 2, 8, 2, 0, 0, interlace)
+    pixels = zlib.compress(b'\0' + b'\x80' * 6 + b'\0' + b'\x40' * 6)
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', ihdr) + _png_chunk(b'IDAT', pixels) +
+            b''.join(_png_chunk(chunk_type, data) for chunk_type, data in chunks_after_idat) +
+            _png_chunk(b'IEND', b''))
+
+
+class TestPngHeaderReader:
+    """Unit tests for the PNG chunk walker behind the bit-depth and chunk checks."""
+    
+    def test_text_after_idat(self, tmp_path):
+        """Test that chunks following IDAT are found without decoding pixels."""
+        png_file = tmp_path / "text_after_idat.png"
+        png_file.write_bytes(_build_png([(b'tEXt', b'Comment\0late'),
+                                         (b'zTXt', b'Note\0\0' + zlib.compress(b'z'))]))
+        header = _read_png_header(png_file)
+        
+        assert header['bit_depth'] == 8
+        assert header['color_type'] == 2
+        assert header['interlaced'] is False
+        assert {b'IHDR', b'IDAT', b'tEXt', b'zTXt', b'IEND'} <= header['chunks']
+        
+        # The validator's text check uses the same chunk list
+        result = validate_png_file(png_file, png_file.name, {'has_text_chunks': True})
+        assert result.tests['has_text_chunks']['passed']
+    
+    def test_truncated_chunk_list(self, tmp_path):
+        """Test that a file cut inside a chunk returns the chunks seen so far."""
+        data = _build_png([(b'tEXt', b'Comment\0late')])
+        png_file = tmp_path / "truncated.png"
+        png_file.write_bytes(data[:data.index(b'tEXt') + 6])
+        header = _read_png_header(png_file)
+        
+        assert header is not None
+        assert b'tEXt' in header['chunks']
+        assert b'IEND' not in header['chunks']
+    
+    def test_truncated_ihdr(self, tmp_path):
+        """Test that a file too short for the IHDR chunk is not parsed."""
+        png_file = tmp_path / "short.png"
+        png_file.write_bytes(_build_png()[:20])
+        
+        assert _read_png_header(png_file) is None
+    
+    def test_interlaced(self, tmp_path):
+        """Test the Adam7 interlace method byte."""
+        png_file = tmp_path / "adam7.png"
+        png_file.write_bytes(_build_png(interlace=1))
+        
+        assert _read_png_header(png_file)['interlaced'] is True
+    
+    def test_not_a_png(self, tmp_path):
+        """Test that a non-PNG file is not parsed."""
+        jpeg_file = tmp_path / "not_png.png"
+        jpeg_file.write_bytes(b'\xff\xd8\xff\xe0' + b'\0' * 40)
+        
+        assert _read_png_header(jpeg_file) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
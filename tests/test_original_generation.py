@@ -9,11 +9,15 @@ from pathlib import Path
 from PIL import Image
 import sys
 import os
+import colorsys
+import numpy as np
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.image_generator import generate_original_images, test_original_compliance
+from src.image_generator import (generate_original_images, test_original_compliance,
+                                 create_jpeg_test_image, create_png_test_image,
+                                 perlin_noise2, hsv_to_rgb_array)
 
 
 class TestOriginalGeneration:
@@ -149,6 +153,86 @@ class TestOriginalGeneration:
         gif_path = output_path / "test_original.gif"
         gif_size = gif_path.stat().st_size
         assert 5000 <= gif_size <= 100000, f"GIF size {gif_size} should be reasonable (5KB-100KB)"
+    
+    def test_generation_is_reproducible(self, temp_output_dir):
+        """Test that two runs write byte-identical originals."""
+        second_dir = Path(temp_output_dir) / "second"
+        assert generate_original_images(temp_output_dir)
+        assert generate_original_images(str(second_dir))
+        
+        for name in ["test_original.jpg", "test_original.png", "test_original.gif"]:
+            first = (Path(temp_output_dir) / name).read_bytes()
+            second = (second_dir / name).read_bytes()
+            assert first == second, f"{name} differs between runs"
+
+
+
+class TestGeneratorHelpers:
+    """Test the NumPy helpers that replaced per-pixel library calls."""
+    
+    # Reference values from noise.pnoise2 (noise 1.2.2), which perlin_noise2
+    # must reproduce exactly now that the noise package is no longer installed
+    PNOISE2_REFERENCE = [
+        # (x, y, octaves, pnoise2)
+        (0.0, 0.0, 1, 0.0),
+        (0.5, 0.25, 1, -0.038818359375),
+        (1.3, 2.7, 1, 0.15553656220436096),
+        (-3.25, -1.75, 1, -0.20895767211914062),
+        (-0.6, 4.1, 2, 0.06137638911604881),
+        (12.34, -56.78, 3, -0.421798974275589),
+        (-100.5, 200.25, 6, -0.0372023805975914),
+        (-0.37, -2.91, 4, -0.12828485667705536),
+        (-7.5, 3.3, 4, -0.1069706454873085),
+        (5.05, -0.02, 4, 0.031449295580387115),
+    ]
+    
+    # First grass row of the JPEG original (y = 160 / 50), octaves=4
+    GRASS_ROW_X = [0, 1, 7, 100, 639]
+    GRASS_ROW_REFERENCE = [-0.0851711556315422, -0.1087404265999794,
+                           -0.18244068324565887, -0.03258881717920303,
+                           -0.10759273916482925]
+    
+    @pytest.mark.parametrize("create_image, size", [
+        (create_jpeg_test_image, (640, 480)),
+        (create_png_test_image, (480, 480)),
+    ])
+    def test_seeded_image_is_deterministic(self, create_image, size):
+        """Test that the same seed draws the same random elements."""
+        first = np.asarray(create_image(*size, seed=1234))
+        second = np.asarray(create_image(*size, seed=1234))
+        
+        np.testing.assert_array_equal(first, second)
+    
+    @pytest.mark.parametrize("x, y, octaves, expected", PNOISE2_REFERENCE)
+    def test_perlin_noise2_matches_pnoise2(self, x, y, octaves, expected):
+        """Test perlin_noise2 against recorded noise.pnoise2 values."""
+        assert float(perlin_noise2(x, y, octaves=octaves)) == expected
+    
+    def test_perlin_noise2_grass_row(self):
+        """Test a broadcast grass row as evaluated by create_jpeg_test_image."""
+        x = (np.array(self.GRASS_ROW_X) / 50)[None, :]
+        y = np.array([160 / 50])[:, None]
+        row = perlin_noise2(x, y, octaves=4)
+        
+        assert row.shape == (1, len(self.GRASS_ROW_X))
+        assert row.dtype == np.float32
+        assert row[0].tolist() == self.GRASS_ROW_REFERENCE
+    
+    def test_hsv_to_rgb_array_matches_colorsys(self):
+        """Test hsv_to_rgb_array against colorsys followed by truncation."""
+        hues = np.linspace(0, 360, 73)  # every 5 degrees, both ends included
+        saturations = np.array([0.0, 0.25, 0.6, 0.8, 1.0])
+        values = np.array([0.0, 0.5, 0.8, 0.9, 1.0])
+        h, s, v = np.meshgrid(hues, saturations, values, indexing='ij')
+        
+        actual = hsv_to_rgb_array(h, s, v)
+        
+        expected = np.array([
+            [int(c * 255) for c in colorsys.hsv_to_rgb(hh / 360.0, ss, vv)]
+            for hh, ss, vv in zip(h.ravel(), s.ravel(), v.ravel())
+        ], dtype=np.uint8).reshape(h.shape + (3,))
+        assert actual.dtype == np.uint8
+        np.testing.assert_array_equal(actual, expected)
 
 
 if __name__ == "__main__":
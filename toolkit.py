@@ -19,6 +19,17 @@ from src.variation_generator import generate_variations, test_variation_complian
 from src.image_comparator import compare_directories
 
 
+def _positive_int(value):
+    """argparse type for options that must be an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point for the toolkit."""
     parser = argparse.ArgumentParser(
@@ -74,6 +85,12 @@ For testing and validation, use pytest:
         action='store_true',
         help='Validate that each variation meets its requirements'
     )
+    var_parser.add_argument(
+        '--workers',
+        type=_positive_int,
+        default=None,
+        help='Concurrent conversions per format (default: based on CPU count)'
+    )
     
     # Compare directories command
     comp_parser = subparsers.add_parser(
@@ -117,7 +134,7 @@ For testing and validation, use pytest:
             
         elif args.command == 'generate-variations':
             print("Generating format variations...")
-            success = generate_variations(args.source_dir, args.output_dir)
+            success = generate_variations(args.source_dir, args.output_dir, args.workers)
             
             if success and args.test_compliance:
                 print("\nTesting variation compliance...")